@@ -1,7 +1,7 @@
 import asyncio
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, TYPE_CHECKING
 import click
 from rich.console import Console
 from rich.table import Table
@@ -9,8 +9,11 @@ from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-from src import XScraper
-from src.ai_analyzer import AnalysisType
+# XScraper and AnalysisType are imported where they are first needed:
+# pulling them in here would load the playwright/openai stack before the
+# menu even renders.
+if TYPE_CHECKING:
+    from src import XScraper
 
 
 console = Console()
@@ -19,11 +22,12 @@ console = Console()
 class XScraperCLI:
     
     def __init__(self) -> None:
-        self.scraper: Optional[XScraper] = None
+        self.scraper: Optional["XScraper"] = None
         self.config_path: str = "config.ini"
     
     async def initialize_scraper(self) -> bool:
         try:
+            from src import XScraper
             with console.status("[bold green]Initializing X-Scraper..."):
                 self.scraper = XScraper(self.config_path)
             
@@ -112,6 +116,7 @@ Features:
         
         analysis_types = []
         if analyze:
+            from src.ai_analyzer import AnalysisType
             console.print("\nAvailable analysis types:")
             available_types = [t.value for t in AnalysisType]
             for i, analysis_type in enumerate(available_types, 1):
@@ -185,6 +190,7 @@ Features:
         
         analysis_types = []
         if analyze:
+            from src.ai_analyzer import AnalysisType
             console.print("\nAvailable analysis types:")
             available_types = [t.value for t in AnalysisType]
             for i, analysis_type in enumerate(available_types, 1):
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import json
 import sys
 from pathlib import Path
@@ -7,7 +9,10 @@ from datetime import datetime
 import click
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-from src import XScraper
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src import XScraper
 from src.exceptions import (
     XScraperError,
     AuthenticationError,
@@ -83,6 +88,7 @@ async def run_scraper_command(
     command_func: Callable[[XScraper], Awaitable[None]],
     error_message: str = "Command failed"
 ) -> None:
+    from src import XScraper
     scraper = XScraper(config_path)
     
     try:
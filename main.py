@@ -1,8 +1,16 @@
+import asyncio
+
 import click
 from rich.console import Console
 
 from cli import user, search, search_historical, interactive, refresh_session
 
+try:
+    import uvloop  # type: ignore
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    uvloop = None  # type: ignore
+
 
 console = Console()
 
@@ -0,0 +1,49 @@
+"""Optional native-extension build for pure-Python hot paths.
+
+The package installs fine as pure Python; this script only exists so that
+deployments with the relevant compilers available can build C extensions:
+
+    python setup.py build_ext --inplace
+
+* ``src/_tweet_extract.py`` is compiled with Cython (per-tweet parsing).
+* ``src/prompts.py`` is compiled with mypyc (pure string assembly, the
+  workload mypyc is designed for; numba-style JITs are a poor fit here).
+
+The compiled modules shadow the pure-Python files when present; nothing
+else in the codebase changes, and either compiler can be missing.
+"""
+from setuptools import setup
+
+ext_modules = []
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    pass
+else:
+    ext_modules += cythonize(
+        ["src/_tweet_extract.py"],
+        compiler_directives={
+            "language_level": 3,
+            "boundscheck": False,
+            "wraparound": False,
+        },
+    )
+
+try:
+    from mypyc.build import mypycify
+except ImportError:
+    pass
+else:
+    # Silence followed imports: mypy would otherwise type-check the whole
+    # src package (pulled in through src/__init__) and abort the build on
+    # errors in modules that are not being compiled.
+    ext_modules += mypycify([
+        "--follow-imports=silent",
+        "--ignore-missing-imports",
+        "src/prompts.py",
+    ])
+
+# Declared explicitly: setuptools' auto-discovery mistakes the src/
+# package for an src-layout root and copies inplace builds to src/src/.
+setup(packages=["src"], package_dir={"src": "src"}, ext_modules=ext_modules)
@@ -1,9 +1,5 @@
-from .config_manager import ConfigManager
-from .twitter_session import TwitterSession
-from .playwright_scraper import PlaywrightScraper
-from .ai_analyzer import AIAnalyzer
-from .scraper import XScraper
-from .checkpoint_manager import CheckpointManager
+from typing import TYPE_CHECKING
+
 from .exceptions import (
     XScraperError,
     AuthenticationError,
@@ -25,6 +21,37 @@ from .exceptions import (
 )
 from .decorators import retry_on_network_error, handle_rate_limit, log_errors
 
+# The component classes pull in playwright, openai, numpy and friends; a
+# PEP 562 __getattr__ loads each submodule on first attribute access so
+# importing the package (e.g. for the CLI or a config check) stays cheap.
+_LAZY_ATTRS = {
+    "ConfigManager": "config_manager",
+    "TwitterSession": "twitter_session",
+    "PlaywrightScraper": "playwright_scraper",
+    "AIAnalyzer": "ai_analyzer",
+    "XScraper": "scraper",
+    "CheckpointManager": "checkpoint_manager",
+}
+
+if TYPE_CHECKING:
+    from .config_manager import ConfigManager
+    from .twitter_session import TwitterSession
+    from .playwright_scraper import PlaywrightScraper
+    from .ai_analyzer import AIAnalyzer
+    from .scraper import XScraper
+    from .checkpoint_manager import CheckpointManager
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "ConfigManager",
     "TwitterSession",
@@ -52,4 +79,4 @@ __all__ = [
     "retry_on_network_error",
     "handle_rate_limit",
     "log_errors"
-]
\ No newline at end of file
+]
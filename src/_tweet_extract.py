@@ -0,0 +1,299 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Hot-path tweet extraction helpers.
+
+This module holds the per-tweet parsing code that runs once for every tweet
+captured from a GraphQL response (potentially thousands per session). It is
+kept free of class state so it can optionally be compiled to a C extension
+with Cython (``python setup.py build_ext --inplace``); the pure-Python module
+is used as-is when no compiled version is present.
+"""
+import logging
+import time
+from typing import Any, Dict, List, Optional, Set
+
+try:
+    import jmespath  # type: ignore
+except ImportError:
+    jmespath = None  # type: ignore
+
+
+logger = logging.getLogger(__name__)
+
+# Non-tweet timeline entries all carry stable entryId prefixes; str.startswith
+# with a tuple checks them in one C-level call per entry.
+_SKIP_PREFIXES = ('cursor-', 'who-to-follow', 'profile-conversation')
+
+
+def _dig(obj: Optional[Dict], *keys: str) -> Any:
+    """Walk nested dicts, returning None as soon as a key is missing."""
+    for key in keys:
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(key)
+    return obj
+
+
+def extract_tweet_id(tweet_result: Dict) -> str:
+    """Pull just the rest_id - the cheap path for resume-search scans."""
+    if tweet_result.get('__typename') == 'TweetWithVisibilityResults':
+        tweet_result = tweet_result.get('tweet', {})
+    return tweet_result.get('rest_id', '')
+
+
+def extract_tweet_data(tweet_result: Dict) -> Optional[Dict[str, Any]]:
+    try:
+        if tweet_result.get('__typename') == 'TweetWithVisibilityResults':
+            tweet_result = tweet_result.get('tweet', {})
+
+        legacy: dict = tweet_result.get('legacy', {})
+        tweet_id = tweet_result.get('rest_id', '')
+
+        user_result: dict = _dig(tweet_result, 'core', 'user_results', 'result') or {}
+        user_legacy: dict = user_result.get('legacy', {})
+
+        media: list = []
+        extended_entities: dict = legacy.get('extended_entities', {})
+        for media_item in extended_entities.get('media', []):
+            media_info = {
+                'type': media_item.get('type', ''),
+                'url': media_item.get('media_url_https', ''),
+                'expanded_url': media_item.get('expanded_url', '')
+            }
+            if media_item.get('type') == 'video':
+                variants = _dig(media_item, 'video_info', 'variants') or []
+
+                best_url = ''
+                best_bitrate = -1
+                for variant in variants:
+                    if variant.get('content_type') == 'video/mp4':
+                        bitrate = variant.get('bitrate', 0)
+                        if bitrate > best_bitrate:
+                            best_bitrate = bitrate
+                            best_url = variant.get('url', '')
+                if best_url:
+                    media_info['video_url'] = best_url
+            media.append(media_info)
+
+        entities: dict = legacy.get('entities') or {}
+
+        urls: list = []
+        for url_entity in entities.get('urls', []):
+            urls.append({
+                'url': url_entity.get('url', ''),
+                'expanded_url': url_entity.get('expanded_url', ''),
+                'display_url': url_entity.get('display_url', '')
+            })
+
+        hashtags = [ht.get('text', '') for ht in entities.get('hashtags', [])]
+
+        tweet_data = {
+            'id': tweet_id,
+            'text': legacy.get('full_text', ''),
+            'full_text': legacy.get('full_text', ''),
+            'created_at': legacy.get('created_at', ''),
+            'user': {
+                'id': user_result.get('rest_id', ''),
+                'username': user_legacy.get('screen_name', ''),
+                'display_name': user_legacy.get('name', ''),
+                'followers_count': user_legacy.get('followers_count', 0),
+                'following_count': user_legacy.get('friends_count', 0),
+                'verified': user_result.get('is_blue_verified', False) or user_legacy.get('verified', False),
+                'profile_image_url': user_legacy.get('profile_image_url_https', ''),
+                'description': user_legacy.get('description', '')
+            },
+            'metrics': {
+                'retweet_count': legacy.get('retweet_count', 0),
+                'favorite_count': legacy.get('favorite_count', 0),
+                'reply_count': legacy.get('reply_count', 0),
+                'quote_count': legacy.get('quote_count', 0),
+                'view_count': _dig(tweet_result, 'views', 'count') or 0
+            },
+            'lang': legacy.get('lang', 'en'),
+            'possibly_sensitive': legacy.get('possibly_sensitive', False),
+            'is_retweet': legacy.get('retweeted', False),
+            'is_reply': legacy.get('in_reply_to_status_id_str') is not None,
+            'is_quote': legacy.get('is_quote_status', False),
+            'hashtags': hashtags,
+            'urls': urls,
+            'media': media,
+            'scraped_at': time.time()
+        }
+
+        return tweet_data
+
+    except Exception as e:
+        logger.debug(f"Error extracting tweet data: {e}")
+        return None
+
+
+def tweets_to_columns(tweets: List[Dict]) -> Dict[str, list]:
+    """Transpose extracted tweets into parallel column lists (AoS -> SoA).
+
+    The list-of-dicts form stays the contract across the codebase (checkpoints,
+    filters, AI analysis all consume it), but columnar views are much cheaper
+    to hand to pandas/numpy or stream to a columnar format: one homogeneous
+    list per field instead of a dict header per tweet.
+    """
+    cols: Dict[str, list] = {
+        'id': [], 'text': [], 'created_at': [], 'lang': [], 'username': [],
+        'retweet_count': [], 'favorite_count': [], 'reply_count': [],
+        'quote_count': [], 'view_count': [],
+    }
+    ids = cols['id']
+    texts = cols['text']
+    created = cols['created_at']
+    langs = cols['lang']
+    usernames = cols['username']
+    retweets = cols['retweet_count']
+    favorites = cols['favorite_count']
+    replies = cols['reply_count']
+    quotes = cols['quote_count']
+    views = cols['view_count']
+    for tweet in tweets:
+        metrics = tweet.get('metrics', {})
+        ids.append(tweet.get('id', ''))
+        texts.append(tweet.get('text', ''))
+        created.append(tweet.get('created_at', ''))
+        langs.append(tweet.get('lang', ''))
+        usernames.append(tweet.get('user', {}).get('username', ''))
+        retweets.append(metrics.get('retweet_count', 0))
+        favorites.append(metrics.get('favorite_count', 0))
+        replies.append(metrics.get('reply_count', 0))
+        quotes.append(metrics.get('quote_count', 0))
+        views.append(metrics.get('view_count', 0))
+    return cols
+
+
+def columns_to_tweets(cols: Dict[str, list]) -> List[Dict]:
+    """Materialize flat row dicts from a columnar view built by tweets_to_columns."""
+    keys = list(cols.keys())
+    return [dict(zip(keys, row)) for row in zip(*cols.values())]
+
+
+def parse_tweets_from_timeline(data: Dict, scraped_ids: Set[str], all_tweets: List[Dict],
+                               existing_ids: Optional[Set[str]] = None,
+                               counters: Optional[Dict[str, int]] = None,
+                               bloom: Any = None,
+                               ids_only: bool = False,
+                               overlap_ids: Optional[Set[str]] = None) -> int:
+    if not jmespath:
+        logger.warning("jmespath not available, skipping tweet parsing")
+        return 0
+
+    added = 0
+    try:
+        logger.debug("Parsing timeline data structure...")
+
+        instructions = jmespath.search('data.user.result.timeline_v2.timeline.instructions', data)
+        if not instructions:
+            instructions = jmespath.search('data.user.result.timeline.timeline.instructions', data)
+        if not instructions:
+            instructions = jmespath.search('data.search_by_raw_query.search_timeline.timeline.instructions', data)
+        if not instructions:
+            instructions = jmespath.search('data.threaded_conversation_with_injections_v2.instructions', data)
+
+        if not instructions:
+            logger.warning("No timeline instructions found in any known format")
+            logger.debug(f"Available data keys: {list(data.get('data', {}).keys()) if 'data' in data else 'no data key'}")
+            return 0
+
+        logger.debug(f"Found {len(instructions)} instructions")
+
+        for instruction in instructions:
+            instruction_type = instruction.get('type')
+            logger.debug(f"Processing instruction type: {instruction_type}")
+
+            if instruction_type == 'TimelineAddEntries':
+                entries: list = instruction.get('entries', [])
+                logger.info(f"Found {len(entries)} entries in timeline")
+
+                tweet_count = 0
+                overlap = 0
+                # Timeline batches redeliver the same entries (pinned tweets
+                # especially), so overlap counts unique matched ids, not raw
+                # occurrences; the caller owns the set and resets it together
+                # with the overlap counter.
+                matched = overlap_ids if overlap_ids is not None else set()
+                skipped_entries = []
+                all_entry_ids = []
+                debug = logger.isEnabledFor(logging.DEBUG)
+                seen = scraped_ids
+                seen_add = scraped_ids.add
+                append = all_tweets.append
+                for entry in entries:
+                    entry_id = entry.get('entryId', '')
+                    if debug:
+                        all_entry_ids.append(entry_id)
+
+                    if entry_id.startswith(_SKIP_PREFIXES):
+                        if debug:
+                            skipped_entries.append(entry_id)
+                        continue
+
+                    tweet_result = _dig(entry, 'content', 'itemContent', 'tweet_results', 'result')
+                    if tweet_result:
+                        if ids_only:
+                            # Resume search only needs IDs to spot the overlap
+                            # zone; the full body/media parse is wasted there.
+                            tweet_id = extract_tweet_id(tweet_result)
+                            if tweet_id:
+                                if tweet_id not in seen:
+                                    seen_add(tweet_id)
+                                    tweet_count += 1
+                                elif existing_ids is not None and tweet_id not in matched:
+                                    if (bloom is None or tweet_id in bloom) and tweet_id in existing_ids:
+                                        matched.add(tweet_id)
+                                        overlap += 1
+                            continue
+                        parsed_tweet = extract_tweet_data(tweet_result)
+                        tweet_id = parsed_tweet.get('id') if parsed_tweet else None
+                        if tweet_id:
+                            if tweet_id not in seen:
+                                seen_add(tweet_id)
+                                append(parsed_tweet)
+                                tweet_count += 1
+                            elif existing_ids is not None and tweet_id not in matched:
+                                # Tweet from a previous session feeds the
+                                # caller's resume/overlap detection; a Bloom
+                                # filter (when supplied) pre-screens the big
+                                # checkpoint set, which confirms any hit.
+                                if (bloom is None or tweet_id in bloom) and tweet_id in existing_ids:
+                                    matched.add(tweet_id)
+                                    overlap += 1
+
+                added += tweet_count
+                if overlap and counters is not None:
+                    counters['overlap'] = counters.get('overlap', 0) + overlap
+                if tweet_count > 0:
+                    logger.info(f"Extracted {tweet_count} tweets from this batch")
+                else:
+                    logger.warning(f"No tweets extracted from {len(entries)} entries")
+                    if all_entry_ids:
+                        logger.debug(f"All entry IDs: {all_entry_ids[:10]}")
+                    if skipped_entries:
+                        logger.debug(f"Skipped entry IDs: {skipped_entries[:5]}")
+
+    except Exception as e:
+        logger.error(f"Error parsing timeline tweets: {e}", exc_info=True)
+
+    return added
+
+
+def parse_single_tweet(data: Dict, scraped_ids: Set[str], all_tweets: List[Dict]) -> int:
+    if not jmespath:
+        return 0
+
+    try:
+        tweet_result = jmespath.search('data.tweetResult.result', data)
+        if tweet_result:
+            parsed_tweet = extract_tweet_data(tweet_result)
+            tweet_id = parsed_tweet.get('id') if parsed_tweet else None
+
+            if tweet_id and tweet_id not in scraped_ids:
+                scraped_ids.add(tweet_id)
+                all_tweets.append(parsed_tweet)
+                return 1
+    except Exception as e:
+        logger.error(f"Error parsing single tweet: {e}")
+
+    return 0
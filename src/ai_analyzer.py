@@ -6,6 +6,7 @@ from enum import Enum
 import json
 
 from .prompts import AnalysisPrompts
+from .prompt_cache import LLMCache, SemanticCache
 
 try:
     import openai  # type: ignore
@@ -32,13 +33,17 @@ class AnalysisType(Enum):
 
 class AIAnalyzer:
     
-    def __init__(self, api_key: str = "", model: str = "gpt-4", 
-                 max_tokens: int = 1000, temperature: float = 0.7):
+    def __init__(self, api_key: str = "", model: str = "gpt-4",
+                 max_tokens: int = 1000, temperature: float = 0.7,
+                 max_concurrent_batches: int = 5):
         self.provider = AIProvider.OPENAI
         self.api_key = api_key
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
+        # Upper bound on in-flight batch requests; tune down if the
+        # OpenAI rate limit starts pushing back.
+        self.max_concurrent_batches = max_concurrent_batches
         
         self.logger = logging.getLogger(__name__)
         self.client = None
@@ -47,6 +52,17 @@ class AIAnalyzer:
 
         self.analysis_cache = {}
         self.cache_ttl = 3600
+
+        # Persistent response cache keyed on the rendered prompt; survives
+        # restarts, unlike the per-run analysis_cache above.
+        try:
+            self.response_cache: Optional[LLMCache] = LLMCache()
+        except Exception as e:
+            self.logger.warning(f"Prompt cache unavailable: {e}")
+            self.response_cache = None
+        # Custom prompts are free-form user text, so back the exact cache
+        # with a similarity lookup that tolerates rewordings.
+        self.semantic_cache = SemanticCache()
         
         self.batch_sizes = {
             AnalysisType.SENTIMENT: 25,    
@@ -117,7 +133,7 @@ class AIAnalyzer:
                              process_func, combine_func) -> Dict[str, Any]:
         self.logger.info(f"Processing {len(batches)} batches for {analysis_type.value} analysis")
         
-        max_concurrent_batches = min(5, len(batches)) 
+        max_concurrent_batches = min(self.max_concurrent_batches, len(batches))
         semaphore = asyncio.Semaphore(max_concurrent_batches)
         
         async def process_single_batch(i: int, batch: Any) -> Dict[str, Any]:
@@ -243,6 +259,63 @@ class AIAnalyzer:
         
         return results
     
+    async def run_all_analyses(self, tweet_texts: List[str]) -> Dict[str, Any]:
+        """Fan out the five text analyses of one batch concurrently.
+
+        analyze_tweets already gathers its tasks, but requires full tweet
+        dicts; this entry point takes a bare text list and overlaps the
+        network latency of all five independent LLM calls.
+        """
+        if not self.client:
+            raise RuntimeError("AI client not initialized")
+
+        names = ('sentiment', 'topics', 'summary', 'classification', 'entities')
+        coros = (
+            self._analyze_sentiment(tweet_texts),
+            self._analyze_topics(tweet_texts),
+            self._generate_summary(tweet_texts),
+            self._classify_tweets(tweet_texts),
+            self._extract_entities(tweet_texts),
+        )
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        return {
+            name: result if not isinstance(result, Exception) else {"error": str(result)}
+            for name, result in zip(names, results)
+        }
+
+    async def analyze_tweets_combined(self, tweets: List[Dict[str, Any]],
+                                      analysis_types: Optional[List[AnalysisType]] = None) -> Dict[str, Any]:
+        """Run several text analyses of one batch as a single LLM call.
+
+        The tweet block dominates prompt tokens, so combining sections
+        embeds it once instead of once per analysis. Only the text-based
+        analyses can be combined; trends/engagement use different inputs
+        and keep their dedicated calls.
+        """
+        if not self.client:
+            raise RuntimeError("AI client not initialized")
+
+        if not tweets:
+            return {"error": "No tweets provided for analysis"}
+
+        combinable = {AnalysisType.SENTIMENT, AnalysisType.TOPICS, AnalysisType.SUMMARY,
+                      AnalysisType.CLASSIFICATION, AnalysisType.ENTITIES}
+        if analysis_types is None:
+            analysis_types = list(combinable)
+        sections = [t.value for t in analysis_types if t in combinable]
+        if not sections:
+            return {"error": "No combinable analysis types requested"}
+
+        essential_data = self._extract_essential_tweet_data(tweets)
+        prompt = AnalysisPrompts.combined_analysis(essential_data['texts'], sections)
+
+        result = await self._make_ai_request(prompt)
+        return {
+            "tweet_count": len(tweets),
+            "analysis_timestamp": time.time(),
+            "analyses": result
+        }
+
     async def _analyze_sentiment(self, tweet_texts: List[str]) -> Dict[str, Any]:
         cache_key = f"sentiment_{hash(str(tweet_texts))}"
         cached_result = self._get_cached_result(cache_key)
@@ -351,9 +424,18 @@ class AIAnalyzer:
         return await self._make_ai_request(prompt)
     
     async def _custom_analysis(self, tweet_texts: List[str], custom_prompt: str) -> Dict[str, Any]:
+        tweet_hash = SemanticCache.tweet_hash(tweet_texts)
+        cached = self.semantic_cache.lookup(custom_prompt, tweet_hash)
+        if cached is not None:
+            self.logger.info("Semantic cache hit for custom analysis")
+            return cached
+
         prompt = AnalysisPrompts.custom_analysis(tweet_texts, custom_prompt)
-        
-        return await self._make_ai_request(prompt)
+
+        result = await self._make_ai_request(prompt)
+        if "error" not in result:
+            self.semantic_cache.store(custom_prompt, tweet_hash, result)
+        return result
     
     async def _analyze_topics_batched(self, tweet_texts: List[str]) -> Dict[str, Any]:
         batch_size = self.batch_sizes[AnalysisType.TOPICS]
@@ -638,9 +720,19 @@ class AIAnalyzer:
     async def _make_openai_request(self, prompt: str) -> Dict[str, Any]:
         if not self.client:
             raise RuntimeError("OpenAI client not initialized")
-            
+
+        cache_key = None
+        if self.response_cache:
+            cache_key = LLMCache.make_key(
+                prompt, self.model, self.temperature,
+                system_hash=AnalysisPrompts.get_system_prompt_hash())
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                self.logger.info("Prompt cache hit, skipping LLM request")
+                return cached
+
         try:
-            response = await self.client.chat.completions.create(  
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": AnalysisPrompts.get_system_prompt()},
@@ -651,11 +743,15 @@ class AIAnalyzer:
             )
             
             content = response.choices[0].message.content
-            
+
             try:
-                return json.loads(content)
+                result = json.loads(content)
             except json.JSONDecodeError:
-                return {"analysis": content, "format": "text"}
+                result = {"analysis": content, "format": "text"}
+
+            if self.response_cache and cache_key:
+                self.response_cache.set(cache_key, result)
+            return result
                 
         except Exception as e:
             raise Exception(f"OpenAI API error: {str(e)}")
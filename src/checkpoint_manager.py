@@ -4,6 +4,16 @@ from pathlib import Path
 from typing import Dict, Optional, List
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
 
 class CheckpointManager:
     
@@ -17,8 +27,209 @@ class CheckpointManager:
         return user_dir / "checkpoint.json"
     
     def get_tweets_file(self, username: str) -> Path:
+        # Read-only legacy path: pre-JSONL installs kept their history
+        # here. New code never writes it; exports go to get_export_file.
         user_dir = self.base_dir / username
         return user_dir / f"tweets_{username}.json"
+
+    def get_export_file(self, username: str) -> Path:
+        user_dir = self.base_dir / username
+        return user_dir / f"tweets_{username}_export.json"
+
+    def get_compressed_tweets_file(self, username: str) -> Path:
+        user_dir = self.base_dir / username
+        return user_dir / f"tweets_{username}.json.zst"
+
+    def get_jsonl_file(self, username: str) -> Path:
+        user_dir = self.base_dir / username
+        return user_dir / f"tweets_{username}.jsonl"
+
+    def get_deltas_dir(self, username: str) -> Path:
+        return self.base_dir / username / "deltas"
+
+    def get_manifest_file(self, username: str) -> Path:
+        return self.base_dir / username / "manifest.json"
+
+    def append_tweets_jsonl(self, username: str, new_tweets: List[Dict]) -> int:
+        """Append this session's tweets to the per-user JSONL log.
+
+        Appending only what's new keeps per-session persistence O(new
+        tweets); rewriting the aggregated JSON every session made a long
+        multi-session scrape quadratic in total IO. The full JSON is still
+        produced by save_all_tweets on explicit export.
+        """
+        if not new_tweets:
+            return 0
+
+        jsonl_file = self.get_jsonl_file(username)
+        jsonl_file.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            with open(jsonl_file, 'ab') as f:
+                self._write_jsonl(f, new_tweets)
+
+            self.logger.info(f"Appended {len(new_tweets)} tweets to {jsonl_file.name}")
+            return len(new_tweets)
+
+        except Exception as e:
+            self.logger.error(f"Failed to append tweets: {e}")
+            return 0
+
+    @staticmethod
+    def _write_jsonl(f, tweets: List[Dict]) -> None:
+        if orjson is not None:
+            for tweet in tweets:
+                f.write(orjson.dumps(tweet, default=str))
+                f.write(b'\n')
+        else:
+            for tweet in tweets:
+                f.write(json.dumps(tweet, separators=(',', ':'),
+                                   default=str).encode('utf-8'))
+                f.write(b'\n')
+
+    def _migrate_legacy(self, username: str) -> None:
+        """Fold a pre-JSONL tweets_{user}.json archive into the JSONL log.
+
+        Installs that predate the delta format keep their history in the
+        aggregated JSON file; without this the first delta write would
+        permanently hide that archive from the loaders, and later
+        sessions would re-scrape and double-store old tweets.
+        """
+        legacy_file = self.get_tweets_file(username)
+        if not legacy_file.exists():
+            return
+        # Once a JSONL log or manifest exists the format migration already
+        # happened, and any tweets_{user}.json on disk is a save_all_tweets
+        # export rather than pre-JSONL history. Folding an export back in
+        # would duplicate every tweet on each export+reload cycle.
+        if (self.get_jsonl_file(username).exists()
+                or self.get_manifest_file(username).exists()):
+            return
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                tweets = json.load(f).get('tweets', [])
+            jsonl_file = self.get_jsonl_file(username)
+            jsonl_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(jsonl_file, 'ab') as f:
+                self._write_jsonl(f, tweets)
+            legacy_file.unlink()
+            self.logger.info(f"Migrated {len(tweets)} tweets from "
+                             f"{legacy_file.name} to {jsonl_file.name}")
+        except Exception as e:
+            self.logger.error(f"Failed to migrate legacy tweets file: {e}")
+
+    def _load_manifest(self, username: str) -> Dict:
+        manifest_file = self.get_manifest_file(username)
+        if manifest_file.exists():
+            try:
+                with open(manifest_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                self.logger.error(f"Failed to load manifest: {e}")
+        return {'session_files': [], 'total': 0,
+                'oldest_tweet_id': None, 'newest_tweet_id': None}
+
+    def _save_manifest(self, username: str, manifest: Dict) -> None:
+        with open(self.get_manifest_file(username), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+
+    def append_delta(self, username: str, new_tweets: List[Dict],
+                     session_number: int) -> int:
+        """Write this session's tweets as a standalone delta file.
+
+        Each session costs one sequential write plus a small manifest
+        update; compact() folds accumulated deltas into the main JSONL log
+        once enough pile up, so the large rewrite is amortized LSM-style
+        instead of paid on every session.
+        """
+        if not new_tweets:
+            return 0
+
+        self._migrate_legacy(username)
+
+        deltas_dir = self.get_deltas_dir(username)
+        deltas_dir.mkdir(parents=True, exist_ok=True)
+        delta_file = deltas_dir / f"session_{session_number}.jsonl"
+
+        try:
+            with open(delta_file, 'ab') as f:
+                self._write_jsonl(f, new_tweets)
+        except Exception as e:
+            self.logger.error(f"Failed to write delta: {e}")
+            return 0
+
+        manifest = self._load_manifest(username)
+        if delta_file.name not in manifest['session_files']:
+            manifest['session_files'].append(delta_file.name)
+        manifest['total'] = manifest.get('total', 0) + len(new_tweets)
+
+        ids = [int(t['id']) for t in new_tweets
+               if isinstance(t.get('id'), str) and t['id'].isdigit()]
+        if ids:
+            lowest, highest = min(ids), max(ids)
+            oldest = manifest.get('oldest_tweet_id')
+            newest = manifest.get('newest_tweet_id')
+            if oldest is None or lowest < int(oldest):
+                manifest['oldest_tweet_id'] = str(lowest)
+            if newest is None or highest > int(newest):
+                manifest['newest_tweet_id'] = str(highest)
+
+        self._save_manifest(username, manifest)
+        self.logger.info(f"Wrote {len(new_tweets)} tweets to {delta_file.name}")
+
+        if len(manifest['session_files']) >= 16:
+            self.compact(username)
+        return len(new_tweets)
+
+    def compact(self, username: str) -> int:
+        """Fold outstanding delta files into the canonical store.
+
+        With zstandard available the compaction target is the compressed
+        full archive: everything on disk is merged through
+        save_all_tweets into tweets_{user}.json.zst and the JSONL log
+        plus deltas are retired. Without it, deltas are appended to the
+        main JSONL log as before.
+        """
+        manifest = self._load_manifest(username)
+        session_files = manifest.get('session_files', [])
+        if not session_files:
+            return 0
+
+        deltas_dir = self.get_deltas_dir(username)
+
+        if zstd is not None:
+            all_tweets = self.load_existing_tweets(username)
+            merged = self.save_all_tweets(username, all_tweets)
+            if merged:
+                self.get_jsonl_file(username).unlink(missing_ok=True)
+                for name in session_files:
+                    (deltas_dir / name).unlink(missing_ok=True)
+                manifest['session_files'] = []
+                self._save_manifest(username, manifest)
+            return merged
+
+        jsonl_file = self.get_jsonl_file(username)
+        jsonl_file.parent.mkdir(parents=True, exist_ok=True)
+        merged = 0
+
+        try:
+            with open(jsonl_file, 'ab') as out:
+                for name in session_files:
+                    delta_file = deltas_dir / name
+                    if not delta_file.exists():
+                        continue
+                    data = delta_file.read_bytes()
+                    out.write(data)
+                    merged += data.count(b'\n')
+            for name in session_files:
+                (deltas_dir / name).unlink(missing_ok=True)
+            manifest['session_files'] = []
+            self._save_manifest(username, manifest)
+            self.logger.info(f"Compacted {merged} tweets into {jsonl_file.name}")
+        except Exception as e:
+            self.logger.error(f"Compaction failed: {e}")
+
+        return merged
     
     def load_checkpoint(self, username: str) -> Optional[Dict]:
         checkpoint_file = self.get_checkpoint_file(username)
@@ -59,9 +270,63 @@ class CheckpointManager:
         except Exception as e:
             self.logger.error(f"Failed to save checkpoint: {e}")
     
+    def _jsonl_paths(self, username: str) -> List[Path]:
+        # The main log plus any deltas not yet folded in by compact().
+        paths = []
+        jsonl_file = self.get_jsonl_file(username)
+        if jsonl_file.exists():
+            paths.append(jsonl_file)
+        deltas_dir = self.get_deltas_dir(username)
+        for name in self._load_manifest(username).get('session_files', []):
+            delta_file = deltas_dir / name
+            if delta_file.exists():
+                paths.append(delta_file)
+        return paths
+
     def load_existing_tweets(self, username: str) -> List[Dict]:
+        self._migrate_legacy(username)
+        loads = orjson.loads if orjson is not None else json.loads
+        tweets: List[Dict] = []
+        found = False
+
+        # The compressed archive and the JSONL log/deltas coexist between
+        # compactions, so the loaded view is the union of both, deduplicated
+        # by id before returning.
+        archive_file = self.get_compressed_tweets_file(username)
+        if zstd is not None and archive_file.exists():
+            found = True
+            try:
+                payload = zstd.ZstdDecompressor().decompress(
+                    archive_file.read_bytes())
+                tweets.extend(loads(payload).get('tweets', []))
+            except Exception as e:
+                self.logger.error(f"Failed to load compressed tweets: {e}")
+
+        jsonl_paths = self._jsonl_paths(username)
+        if jsonl_paths:
+            found = True
+            try:
+                for path in jsonl_paths:
+                    with open(path, 'rb') as f:
+                        tweets.extend(loads(line) for line in f if line.strip())
+            except Exception as e:
+                self.logger.error(f"Failed to load existing tweets: {e}")
+
+        if found:
+            unique_tweets = {}
+            without_ids = []
+            for tweet in tweets:
+                tweet_id = tweet.get('id')
+                if not tweet_id:
+                    without_ids.append(tweet)
+                elif tweet_id not in unique_tweets:
+                    unique_tweets[tweet_id] = tweet
+            tweets = list(unique_tweets.values()) + without_ids
+            self.logger.info(f"Loaded {len(tweets)} existing tweets for @{username}")
+            return tweets
+
         tweets_file = self.get_tweets_file(username)
-        
+
         if not tweets_file.exists():
             self.logger.info(f"No existing tweets file found for @{username}")
             return []
@@ -78,10 +343,13 @@ class CheckpointManager:
             self.logger.error(f"Failed to load existing tweets: {e}")
             return []
     
-    def save_all_tweets(self, username: str, all_tweets: List[Dict], user_data: Optional[Dict] = None, 
+    def save_all_tweets(self, username: str, all_tweets: List[Dict], user_data: Optional[Dict] = None,
                        checkpoint_data: Optional[Dict] = None):
-        tweets_file = self.get_tweets_file(username)
-        
+        # The uncompressed export must not land on the legacy
+        # tweets_{user}.json path, or _migrate_legacy would fold it back
+        # into the JSONL log on the next load.
+        tweets_file = self.get_export_file(username)
+
         try:
             unique_tweets = {}
             for tweet in all_tweets:
@@ -106,10 +374,27 @@ class CheckpointManager:
                 'tweets': sorted_tweets
             }
             
-            with open(tweets_file, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False, default=str)
-            
-            self.logger.info(f"Saved {len(sorted_tweets)} total tweets to {tweets_file.name}")
+            if zstd is not None:
+                # Full exports grow without bound; level-3 zstd shrinks
+                # JSON text 3-5x for negligible CPU, and threads=-1
+                # spreads the compression over all cores.
+                if orjson is not None:
+                    payload = orjson.dumps(output_data, default=str,
+                                           option=orjson.OPT_INDENT_2)
+                else:
+                    payload = json.dumps(output_data, indent=2,
+                                         ensure_ascii=False,
+                                         default=str).encode('utf-8')
+                compressed = zstd.ZstdCompressor(
+                    level=3, threads=-1).compress(payload)
+                archive_file = self.get_compressed_tweets_file(username)
+                archive_file.write_bytes(compressed)
+                self.logger.info(f"Saved {len(sorted_tweets)} total tweets to {archive_file.name}")
+            else:
+                with open(tweets_file, 'w', encoding='utf-8') as f:
+                    json.dump(output_data, f, indent=2, ensure_ascii=False, default=str)
+
+                self.logger.info(f"Saved {len(sorted_tweets)} total tweets to {tweets_file.name}")
             
             return len(sorted_tweets)
             
@@ -42,7 +42,8 @@ class ConfigManager:
             'openai_api_key': self.config.get('AI', 'openai_api_key', fallback=''),
             'model': self.config.get('AI', 'model', fallback='gpt-4'),
             'max_tokens': self.config.getint('AI', 'max_tokens', fallback=1000),
-            'temperature': self.config.getfloat('AI', 'temperature', fallback=0.7)
+            'temperature': self.config.getfloat('AI', 'temperature', fallback=0.7),
+            'max_concurrent_batches': self.config.getint('AI', 'max_concurrent_batches', fallback=5)
         }
     
     def get_scraping_settings(self) -> Dict[str, Any]:
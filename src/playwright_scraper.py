@@ -1,23 +1,227 @@
 import asyncio
+import functools
+import hashlib
 import logging
 import json
+import pickle
 import time
 import random
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Any
 import urllib.parse
+from collections import deque
 from playwright.async_api import async_playwright, Page, Response, Browser, BrowserContext
 from .exceptions import PageLoadError
 from .decorators import retry_on_network_error
+from . import _tweet_extract
 
 try:
     import jmespath  # type: ignore
 except ImportError:
     jmespath = None  # type: ignore
 
+try:
+    import orjson  # type: ignore
+    _json_loads = orjson.loads
+
+    def _json_dump_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+
+    def _json_dump_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str)
+except ImportError:
+    orjson = None  # type: ignore
+    _json_loads = json.loads
+
+    def _json_dump_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
+    def _json_dump_line(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, default=str).encode('utf-8')
+
+# Below this size the thread-pool hop costs more than the decode itself.
+_INLINE_DECODE_LIMIT = 32 * 1024
+
+
+try:
+    from pybloom_live import ScalableBloomFilter  # type: ignore
+except ImportError:
+    ScalableBloomFilter = None  # type: ignore
+
+# Checkpoint-ID sets below this size don't justify building a Bloom filter.
+_BLOOM_THRESHOLD = 10_000
+
+# Shared empty sentinel for "no checkpoint IDs" - avoids allocating a fresh
+# set per call on the scroll/session hot paths.
+_EMPTY_FROZEN: frozenset = frozenset()
+
+_API_MARKERS = ('graphql', 'api.twitter.com', 'api.x.com')
+
+try:
+    import ahocorasick  # type: ignore
+
+    _AC = ahocorasick.Automaton()
+    for _marker in _API_MARKERS:
+        _AC.add_word(_marker, _marker)
+    _AC.make_automaton()
+except ImportError:
+    _AC = None
+
+
+# Resource types aborted at the route layer: none are needed to render the
+# timeline markup, and dropping them cuts bandwidth and renderer CPU per
+# scroll substantially.
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+# Tweets render as <article data-testid="tweet"> elements; the selector is
+# pinned here so every wait/count site uses the same string.
+TWEET_SELECTOR = '[data-testid="tweet"]'
+
+# One scroll step per CDP round trip: scrolls and reports page state in a
+# single evaluate, instead of separate scroll / bottom-check calls. Tweet
+# counting walks the live getElementsByTagName('article') collection, which
+# is considerably cheaper than querySelectorAll on a large timeline DOM.
+_SCROLL_STEP_JS = '''
+() => {
+    window.scrollBy(0, window.innerHeight * 0.8);
+    let domTweets = 0;
+    const articles = document.getElementsByTagName('article');
+    for (let i = 0; i < articles.length; i++) {
+        if (articles[i].getAttribute('data-testid') === 'tweet') domTweets++;
+    }
+    return {
+        atBottom: window.innerHeight + window.scrollY >= document.body.scrollHeight - 100,
+        scrollY: window.scrollY,
+        domTweets: domTweets
+    };
+}
+'''
+
+# Pushes a signal to Python the moment new <article> nodes land, so the
+# scroll loop can wake on content instead of polling the DOM.
+_NEW_CONTENT_OBSERVER_JS = '''
+(() => {
+    const notify = () => { if (window.__pyNewContent) window.__pyNewContent(1); };
+    const observer = new MutationObserver((mutations) => {
+        for (const m of mutations) {
+            for (const node of m.addedNodes) {
+                if (node.nodeType === 1 &&
+                    (node.tagName === 'ARTICLE' || (node.querySelector && node.querySelector('article')))) {
+                    notify();
+                    return;
+                }
+            }
+        }
+    });
+    const start = () => observer.observe(document.body, {childList: true, subtree: true});
+    if (document.body) { start(); } else { window.addEventListener('DOMContentLoaded', start); }
+})();
+'''
+
+# Used with wait_for_function(arg=<previous count>) for the adaptive delay.
+_TWEET_COUNT_GROWS_JS = '''
+n => {
+    let count = 0;
+    const articles = document.getElementsByTagName('article');
+    for (let i = 0; i < articles.length; i++) {
+        if (articles[i].getAttribute('data-testid') === 'tweet') count++;
+    }
+    return count > n;
+}
+'''
+
+
+def _is_api_url(url: str) -> bool:
+    """Fast-reject predicate for the response interceptor.
+
+    Playwright does not expose a CDP-side URL filter for response events, so
+    every response round-trips to Python; this keeps the reject path cheap.
+    With pyahocorasick installed all markers are matched in one linear scan
+    of the URL; otherwise it falls back to independent substring scans.
+    """
+    if _AC is not None:
+        return next(_AC.iter(url), None) is not None
+    return 'graphql' in url or 'api.twitter.com' in url or 'api.x.com' in url
+
+
+_LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+]
+
+
+class BrowserContextPool:
+    """Pool of warm BrowserContexts sharing one browser.
+
+    Creating a context is cheap next to launching Chromium, but a recycled
+    context keeps its HTTP cache and cookies, so repeat scrapes against the
+    same site skip the cold-cache penalty. Contexts are prepared once
+    (cookies + route filter) and returned to the pool with their pages
+    closed.
+    """
+
+    def __init__(self, browser: Browser, context_options: Dict,
+                 cookies: Optional[list] = None, route_handler=None):
+        self._browser = browser
+        self._options = context_options
+        self._cookies = cookies
+        self._route_handler = route_handler
+        self._idle: deque = deque()
+
+    async def acquire(self) -> BrowserContext:
+        if self._idle:
+            return self._idle.popleft()
+        context = await self._browser.new_context(**self._options)
+        if self._cookies:
+            await context.add_cookies(self._cookies)
+        if self._route_handler:
+            await context.route("**/*", self._route_handler)
+        return context
+
+    async def release(self, context: BrowserContext):
+        for page in context.pages:
+            try:
+                await page.close()
+            except Exception:
+                pass
+        self._idle.append(context)
+
+    def lease(self) -> '_ContextLease':
+        return _ContextLease(self)
+
+    async def close(self):
+        while self._idle:
+            try:
+                await self._idle.popleft().close()
+            except Exception:
+                pass
+
+
+class _ContextLease:
+    def __init__(self, pool: BrowserContextPool):
+        self._pool = pool
+        self._context: Optional[BrowserContext] = None
+
+    async def __aenter__(self) -> BrowserContext:
+        self._context = await self._pool.acquire()
+        return self._context
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._context is not None:
+            await self._pool.release(self._context)
+
 
 class PlaywrightScraper:
+    # Shared (playwright, browser) pairs keyed by launch options, so
+    # multi-user runs skip the ~1-2s Chromium startup per scraper.
+    _browser_cache: Dict[Any, Any] = {}
+
     def __init__(self, username: str, password: str, email: str, scraping_config: Dict, timeout_config: Dict, proxy_config: Optional[Dict] = None, progress_manager=None):
         self.username = username
         self.password = password
@@ -25,14 +229,33 @@ class PlaywrightScraper:
         self.proxy_config = proxy_config
         self.progress_manager = progress_manager
         self.logger = logging.getLogger(__name__)
+        self._proxy_arg = self._build_proxy_arg(proxy_config)
         self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None 
         self.scraped_tweet_ids = set()
+        self.existing_tweet_ids = set()
+        self._session_counters = {'overlap': 0}
+        self._overlap_ids: set = set()
+        self._ids_only_phase = False
+        self._existing_bloom = None
+        self._context_pool: Optional[BrowserContextPool] = None
+        self._new_content_event: Optional[asyncio.Event] = None
+        self._ensured_dirs: set = set()
+        # Incremental JSONL journal: tweets are appended as they are parsed,
+        # so a crash mid-session loses at most the OS write buffer.
+        self._journal_fp = None
+        self._journal_path: Optional[Path] = None
+        # Coalesces concurrent identical search scrapes onto one in-flight
+        # future, keyed by a hash of (username, since, until).
+        self._inflight: Dict[str, asyncio.Future] = {}
         self.all_tweets = []
         self.user_data = None
-        self.captured_requests = []
+        # Debug trail of recently handled GraphQL responses. Bounded, and
+        # deliberately without payloads - retaining parsed response bodies
+        # here duplicated all_tweets and grew RSS for the whole session.
+        self.captured_requests = deque(maxlen=64)
         self.cookies_file = "playwright_cookies.json"
         self.is_logged_in = False     
         self.current_username = None
@@ -45,43 +268,50 @@ class PlaywrightScraper:
         self.max_tweets_per_session = None
         self.overlap_threshold = scraping_config['overlap_detection_threshold']
         self.timeouts = timeout_config
-        
+
+        self._op_handlers = {
+            'UserByScreenName': self._parse_user_data,
+            'UserTweets': self._parse_tweets_from_timeline,
+            'SearchTimeline': self._parse_tweets_from_timeline,
+            'SearchAdaptive': self._parse_tweets_from_timeline,
+            'TweetDetail': self._parse_single_tweet,
+            'TweetResultByRestId': self._parse_single_tweet,
+        }
+
         self.logger.info("Playwright scraper initialized")
-    
+
+    @staticmethod
+    def _build_proxy_arg(proxy_config: Optional[Dict]) -> Optional[Dict]:
+        """Parse the configured host:port:user:pass proxy into Playwright form.
+
+        Done once at construction; maxsplit keeps passwords containing ':'
+        intact, which the old per-startup 4-way split silently broke.
+        """
+        if not (proxy_config and proxy_config.get('enable_proxy_rotation')):
+            return None
+        proxy_list = proxy_config.get('proxies', [])
+        if not proxy_list:
+            return None
+        parts = proxy_list[0].split(':', 3)
+        if len(parts) != 4:
+            return None
+        host, port, username, password = parts
+        return {
+            'server': f'http://{host}:{port}',
+            'username': username,
+            'password': password
+        }
+
     async def initialize(self): 
         try:
-            self.playwright = await async_playwright().start()
-            
-            browser_args = {
-                'headless': False, 
-                'args': [
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-background-timer-throttling',
-                    '--disable-backgrounding-occluded-windows',
-                    '--disable-renderer-backgrounding',
-                ]
-            }
-            
-            if self.proxy_config and self.proxy_config.get('enable_proxy_rotation'):
-                proxy_list = self.proxy_config.get('proxies', [])
-                if proxy_list:
-                    proxy_str = proxy_list[0]
-                    parts = proxy_str.split(':')
-                    if len(parts) == 4:
-                        host, port, username, password = parts
-                        browser_args['proxy'] = {
-                            'server': f'http://{host}:{port}',
-                            'username': username,
-                            'password': password
-                        }
-                        self.logger.info(f"Using proxy: {username}@{host}:{port}")
-                        self.logger.info("Note: First connection through proxy may take 30-60 seconds...")
-            
-            self.browser = await self.playwright.chromium.launch(**browser_args)
-            
+            if self._proxy_arg:
+                self.logger.info(f"Using proxy: {self._proxy_arg['username']}@{self._proxy_arg['server']}")
+                self.logger.info("Note: First connection through proxy may take 30-60 seconds...")
+
+            self.playwright, self.browser = await self.get_or_create_browser(
+                headless=False, proxy=self._proxy_arg
+            )
+
             self.context = await self.browser.new_context(
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -89,82 +319,172 @@ class PlaywrightScraper:
                 timezone_id='America/New_York'
             )
             
+            await self.context.route("**/*", self._filter_route)
+
+            self.page = await self.context.new_page()
+
             cookies_loaded = False
             if Path(self.cookies_file).exists():
                 try:
-                    cookies_data = json.loads(Path(self.cookies_file).read_text())
-                    if cookies_data:  
-                        await self.context.add_cookies(cookies_data)
+                    cookies_data = self._load_cookies()
+                    if cookies_data:
+                        await self._set_cookies_bulk(cookies_data)
                         self.logger.info("Loaded saved cookies - will skip login")
-                        self.is_logged_in = True 
+                        self.is_logged_in = True
                         cookies_loaded = True
                 except Exception as e:
                     self.logger.warning(f"Failed to load cookies: {e}")
-            
+
             if not cookies_loaded:
                 self.logger.info("No saved cookies found - will need to login")
-            
-            self.page = await self.context.new_page()
-            
-            
+
             self.page.on("response", self._intercept_response)
-            
+
+            try:
+                event = asyncio.Event()
+                await self.page.expose_binding(
+                    "__pyNewContent", lambda source, count: event.set())
+                await self.page.add_init_script(_NEW_CONTENT_OBSERVER_JS)
+                self._new_content_event = event
+            except Exception as e:
+                self.logger.debug(f"MutationObserver signal unavailable: {e}")
+
             self.logger.info("Playwright browser initialized successfully")
             return True
-            
+
         except Exception as e:
             self.logger.error(f"Failed to initialize Playwright: {e}")
             return False
-    
+
+    @classmethod
+    async def get_or_create_browser(cls, headless: bool, proxy: Optional[Dict]):
+        """Return a shared (playwright, browser) pair, launching one if needed.
+
+        Memoized on the launch options so sequential scrapes reuse the same
+        Chromium process instead of paying startup cost each time.
+        """
+        key = (headless, proxy['server'] if proxy else None)
+        cached = cls._browser_cache.get(key)
+        if cached is not None and cached[1].is_connected():
+            return cached
+
+        playwright = await async_playwright().start()
+        browser_args = {'headless': headless, 'args': list(_LAUNCH_ARGS)}
+        if proxy:
+            browser_args['proxy'] = proxy
+        browser = await playwright.chromium.launch(**browser_args)
+        cls._browser_cache[key] = (playwright, browser)
+        return playwright, browser
+
+    @staticmethod
+    async def _filter_route(route):
+        if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _set_cookies_bulk(self, cookies_data: list):
+        """Install cookies in one CDP round trip, falling back to add_cookies."""
+        try:
+            cdp = await self.context.new_cdp_session(self.page)
+            await cdp.send('Network.setCookies', {'cookies': cookies_data})
+            await cdp.detach()
+        except Exception as e:
+            self.logger.debug(f"Bulk cookie set failed, using add_cookies: {e}")
+            await self.context.add_cookies(cookies_data)
+
+    def _load_cookies(self) -> Optional[list]:
+        """Load cookies, preferring a pickle sidecar keyed by the JSON mtime.
+
+        Pickle of an already-parsed list-of-dicts deserializes far faster than
+        re-parsing the JSON, which matters on frequent restarts. The sidecar
+        name embeds st_mtime_ns, so an edited cookies file never hits a stale
+        cache.
+        """
+        cookie_path = Path(self.cookies_file)
+        st = cookie_path.stat()
+        cache_path = Path(f"{self.cookies_file}.{st.st_mtime_ns}.pkl")
+        if cache_path.exists():
+            try:
+                return pickle.loads(cache_path.read_bytes())
+            except Exception as e:
+                self.logger.debug(f"Cookie cache unreadable, re-parsing JSON: {e}")
+
+        cookies_data = _json_loads(cookie_path.read_bytes())
+        try:
+            self._drop_stale_cookie_caches()
+            cache_path.write_bytes(pickle.dumps(cookies_data, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception as e:
+            self.logger.debug(f"Could not write cookie cache: {e}")
+        return cookies_data
+
+    def _drop_stale_cookie_caches(self):
+        cookie_path = Path(self.cookies_file)
+        for stale in cookie_path.parent.glob(cookie_path.name + ".*.pkl"):
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+    def _write_cookies(self, cookies: list):
+        Path(self.cookies_file).write_text(json.dumps(cookies, indent=2))
+        self._drop_stale_cookie_caches()
+
+    async def _save_cookies(self) -> list:
+        """Snapshot context cookies and persist them without blocking the loop.
+
+        The disk write happens in a worker thread so the response interceptor
+        keeps running during the login/verification dance.
+        """
+        cookies = await self.context.cookies()
+        await asyncio.to_thread(self._write_cookies, cookies)
+        return cookies
+
     async def _intercept_response(self, response: Response):
+        url = response.url
+        if not _is_api_url(url):
+            return
+
         try:
-            
-            if response.request.resource_type in ["xhr", "fetch"]:
-                url = response.url
-                
-                if 'graphql' in url.lower() or 'api.twitter.com' in url or 'api.x.com' in url:
-                    if '/' in url:
-                        parts = url.split('/')
-                        for i, part in enumerate(parts):
-                            if 'graphql' in part.lower() and i + 1 < len(parts):
-                                operation = parts[i + 1].split('?')[0]
-                                self.logger.debug(f"GraphQL: {operation}")
-                                break
-                
-                
-                if any(endpoint in url for endpoint in [
-                    'UserByScreenName',
-                    'UserTweets',
-                    'TweetDetail',
-                    'TweetResultByRestId',
-                    'SearchTimeline',
-                    'SearchAdaptive'
-                ]):
-                    try:
-                        data = await response.json()
-                        self.captured_requests.append({
-                            'url': url,
-                            'data': data,
-                            'timestamp': time.time()
-                        })
-                        
-                        
-                        if 'UserByScreenName' in url:
-                            self.logger.info("Parsing UserByScreenName response")
-                            self._parse_user_data(data)
-                        elif 'UserTweets' in url:
-                            self.logger.info("Parsing UserTweets response")
-                            self._parse_tweets_from_timeline(data)
-                        elif 'SearchTimeline' in url or 'SearchAdaptive' in url:
-                            self.logger.info("Parsing Search response")
-                            self._parse_tweets_from_timeline(data)
-                        elif 'TweetResultByRestId' in url or 'TweetDetail' in url:
-                            self.logger.info("Parsing TweetDetail response")
-                            self._parse_single_tweet(data)
-                            
-                    except Exception as e:
-                        self.logger.warning(f"Failed to parse response from {url[:100]}: {e}")
-                        
+            # GraphQL URLs look like .../i/api/graphql/<hash>/<Op>?...,
+            # so the operation name is the last path segment.
+            qmark = url.find('?')
+            path_end = qmark if qmark != -1 else len(url)
+            op = url[url.rfind('/', 0, path_end) + 1:path_end]
+
+            handler = self._op_handlers.get(op)
+            if handler is None:
+                return
+
+            # .request crosses into Playwright's object layer, so only touch
+            # it once the URL has already matched a known operation.
+            if response.request.resource_type not in ("xhr", "fetch"):
+                return
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("GraphQL: %s", op)
+
+            try:
+                # Decode large payloads off the event loop so the CDP
+                # pump keeps draining during scroll bursts; small ones
+                # aren't worth the thread hop.
+                body = await response.body()
+                if len(body) < _INLINE_DECODE_LIMIT:
+                    data = _json_loads(body)
+                else:
+                    data = await asyncio.to_thread(_json_loads, body)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.captured_requests.append({
+                        'url': url,
+                        'timestamp': time.time()
+                    })
+
+                self.logger.info("Parsing %s response", op)
+                handler(data)
+
+            except Exception as e:
+                self.logger.warning(f"Failed to parse response from {url[:100]}: {e}")
+
         except Exception as e:
             self.logger.debug(f"Error in response interceptor: {e}")
     
@@ -197,169 +517,68 @@ class PlaywrightScraper:
         except Exception as e:
             self.logger.error(f"Error parsing user data: {e}")
     
-    def _parse_tweets_from_timeline(self, data: Dict):
-        if not jmespath:
-            self.logger.warning("jmespath not available, skipping tweet parsing")
-            return
-            
+    def _open_journal(self, username: str):
+        self._close_journal()
         try:
-            self.logger.debug(f"Parsing timeline data structure...")
-            
-            instructions = jmespath.search('data.user.result.timeline_v2.timeline.instructions', data)
-            if not instructions:
-                instructions = jmespath.search('data.user.result.timeline.timeline.instructions', data)
-            if not instructions:
-                instructions = jmespath.search('data.search_by_raw_query.search_timeline.timeline.instructions', data)
-            if not instructions:
-                instructions = jmespath.search('data.threaded_conversation_with_injections_v2.instructions', data)
-            
-            if not instructions:
-                self.logger.warning("No timeline instructions found in any known format")
-                self.logger.debug(f"Available data keys: {list(data.get('data', {}).keys()) if 'data' in data else 'no data key'}")
-                return
-            
-            self.logger.debug(f"Found {len(instructions)} instructions")
-            
-            for instruction in instructions:
-                instruction_type = instruction.get('type')
-                self.logger.debug(f"Processing instruction type: {instruction_type}")
-                
-                if instruction_type == 'TimelineAddEntries':
-                    entries = instruction.get('entries', [])
-                    self.logger.info(f"Found {len(entries)} entries in timeline")
-                    
-                    tweet_count = 0
-                    skipped_entries = []
-                    all_entry_ids = []
-                    for entry in entries:
-                        entry_id = entry.get('entryId', '')
-                        all_entry_ids.append(entry_id)
-                        
-                        if any(skip_type in entry_id for skip_type in ['cursor-', 'who-to-follow', 'profile-conversation']):
-                            skipped_entries.append(entry_id)
-                            continue
-                        
-                        tweet_result = jmespath.search('content.itemContent.tweet_results.result', entry)
-                        if tweet_result:
-                            parsed_tweet = self._extract_tweet_data(tweet_result)
-                            tweet_id = parsed_tweet.get('id') if parsed_tweet else None
-                            if parsed_tweet and tweet_id:
-                                if tweet_id not in self.scraped_tweet_ids:
-                                    if not hasattr(self, 'existing_tweet_ids') or tweet_id not in self.existing_tweet_ids:
-                                        self.all_tweets.append(parsed_tweet)
-                                        self.scraped_tweet_ids.add(tweet_id)
-                                        tweet_count += 1
-                    
-                    if tweet_count > 0:
-                        self.logger.info(f"Extracted {tweet_count} tweets from this batch")
-                    else:
-                        self.logger.warning(f"No tweets extracted from {len(entries)} entries")
-                        if all_entry_ids:
-                            self.logger.debug(f"All entry IDs: {all_entry_ids[:10]}")
-                        if skipped_entries:
-                            self.logger.debug(f"Skipped entry IDs: {skipped_entries[:5]}")  
-                                
+            data_dir = Path(f"data/{username}")
+            if username not in self._ensured_dirs:
+                data_dir.mkdir(parents=True, exist_ok=True)
+                self._ensured_dirs.add(username)
+            self._journal_path = data_dir / f"journal_{time.strftime('%Y%m%d_%H%M%S')}.jsonl"
+            self._journal_fp = open(self._journal_path, 'ab')
         except Exception as e:
-            self.logger.error(f"Error parsing timeline tweets: {e}", exc_info=True)
-    
-    def _parse_single_tweet(self, data: Dict):
-        if not jmespath:
+            self.logger.warning(f"Could not open tweet journal: {e}")
+            self._journal_fp = None
+            self._journal_path = None
+
+    def _journal_tweets(self, tweets: list):
+        fp = self._journal_fp
+        if fp is None or not tweets:
             return
-            
         try:
-            tweet_result = jmespath.search('data.tweetResult.result', data)
-            if tweet_result:
-                parsed_tweet = self._extract_tweet_data(tweet_result)
-                tweet_id = parsed_tweet.get('id') if parsed_tweet else None
-                
-                if parsed_tweet and tweet_id and tweet_id not in self.scraped_tweet_ids:
-                    if not hasattr(self, 'existing_tweet_ids') or tweet_id not in self.existing_tweet_ids:
-                        self.all_tweets.append(parsed_tweet)
-                        self.scraped_tweet_ids.add(tweet_id)
+            fp.write(b''.join(_json_dump_line(tweet) + b'\n' for tweet in tweets))
         except Exception as e:
-            self.logger.error(f"Error parsing single tweet: {e}")
-    
-    def _extract_tweet_data(self, tweet_result: Dict) -> Optional[Dict[str, Any]]:
+            self.logger.debug(f"Journal write failed: {e}")
+
+    def _truncate_journal(self):
+        if self._journal_fp is None or self._journal_path is None:
+            return
         try:
-            
-            if tweet_result.get('__typename') == 'TweetWithVisibilityResults':
-                tweet_result = tweet_result.get('tweet', {})
-            
-            legacy = tweet_result.get('legacy', {})
-            tweet_id = tweet_result.get('rest_id', '')
-            
-            
-            user_result = tweet_result.get('core', {}).get('user_results', {}).get('result', {})
-            user_legacy = user_result.get('legacy', {})
-            
-            
-            media = []
-            extended_entities = legacy.get('extended_entities', {})
-            for media_item in extended_entities.get('media', []):
-                media_info = {
-                    'type': media_item.get('type', ''),
-                    'url': media_item.get('media_url_https', ''),
-                    'expanded_url': media_item.get('expanded_url', '')
-                }
-                if media_item.get('type') == 'video':
-                    variants = media_item.get('video_info', {}).get('variants', [])
-                    
-                    video_variants = [v for v in variants if v.get('content_type') == 'video/mp4']
-                    if video_variants:
-                        media_info['video_url'] = max(video_variants, key=lambda x: x.get('bitrate', 0))['url']
-                media.append(media_info)
-            
-            
-            urls = []
-            for url_entity in legacy.get('entities', {}).get('urls', []):
-                urls.append({
-                    'url': url_entity.get('url', ''),
-                    'expanded_url': url_entity.get('expanded_url', ''),
-                    'display_url': url_entity.get('display_url', '')
-                })
-            
-            hashtags = [ht.get('text', '') for ht in legacy.get('entities', {}).get('hashtags', [])]
-            
-            
-            tweet_data = {
-                'id': tweet_id,
-                'text': legacy.get('full_text', ''),
-                'full_text': legacy.get('full_text', ''),
-                'created_at': legacy.get('created_at', ''),
-                'user': {
-                    'id': user_result.get('rest_id', ''),
-                    'username': user_legacy.get('screen_name', ''),
-                    'display_name': user_legacy.get('name', ''),
-                    'followers_count': user_legacy.get('followers_count', 0),
-                    'following_count': user_legacy.get('friends_count', 0),
-                    'verified': user_result.get('is_blue_verified', False) or user_legacy.get('verified', False),
-                    'profile_image_url': user_legacy.get('profile_image_url_https', ''),
-                    'description': user_legacy.get('description', '')
-                },
-                'metrics': {
-                    'retweet_count': legacy.get('retweet_count', 0),
-                    'favorite_count': legacy.get('favorite_count', 0),
-                    'reply_count': legacy.get('reply_count', 0),
-                    'quote_count': legacy.get('quote_count', 0),
-                    'view_count': tweet_result.get('views', {}).get('count', 0)
-                },
-                'lang': legacy.get('lang', 'en'),
-                'possibly_sensitive': legacy.get('possibly_sensitive', False),
-                'is_retweet': legacy.get('retweeted', False),
-                'is_reply': legacy.get('in_reply_to_status_id_str') is not None,
-                'is_quote': legacy.get('is_quote_status', False),
-                'hashtags': hashtags,
-                'urls': urls,
-                'media': media,
-                'scraped_at': time.time()
-            }
-            
-            return tweet_data
-            
+            self._journal_fp.close()
+            self._journal_fp = open(self._journal_path, 'wb')
         except Exception as e:
-            self.logger.debug(f"Error extracting tweet data: {e}")
-            return None
-    
+            self.logger.debug(f"Journal truncate failed: {e}")
+            self._journal_fp = None
+
+    def _close_journal(self):
+        if self._journal_fp is not None:
+            try:
+                self._journal_fp.close()
+            except Exception:
+                pass
+            self._journal_fp = None
+            self._journal_path = None
+
+    def _parse_tweets_from_timeline(self, data: Dict):
+        before = len(self.all_tweets)
+        _tweet_extract.parse_tweets_from_timeline(
+            data, self.scraped_tweet_ids, self.all_tweets,
+            existing_ids=self.existing_tweet_ids, counters=self._session_counters,
+            bloom=self._existing_bloom, ids_only=self._ids_only_phase,
+            overlap_ids=self._overlap_ids)
+        if self._journal_fp is not None and len(self.all_tweets) > before:
+            self._journal_tweets(self.all_tweets[before:])
+
+    def _parse_single_tweet(self, data: Dict):
+        _tweet_extract.parse_single_tweet(data, self.scraped_tweet_ids, self.all_tweets)
+
+    def _extract_tweet_data(self, tweet_result: Dict) -> Optional[Dict[str, Any]]:
+        return _tweet_extract.extract_tweet_data(tweet_result)
+
+    def get_tweet_columns(self) -> Dict[str, list]:
+        """Columnar (SoA) view of the tweets scraped so far, for analytics sinks."""
+        return _tweet_extract.tweets_to_columns(self.all_tweets)
+
     async def login(self) -> bool:
         if not self.page or not self.context:
             raise RuntimeError("Browser not initialized")
@@ -474,10 +693,9 @@ class PlaywrightScraper:
                 self.is_logged_in = True
                 
                 
-                cookies = await self.context.cookies()
-                Path(self.cookies_file).write_text(json.dumps(cookies, indent=2))
+                cookies = await self._save_cookies()
                 self.logger.info(f"Saved {len(cookies)} cookies to {self.cookies_file}")
-                
+
                 self.logger.info("Successfully logged in to Twitter")
                 return True
             except:
@@ -491,8 +709,7 @@ class PlaywrightScraper:
                         compose_button = await self.page.query_selector('[data-testid="SideNav_NewTweet_Button"]')
                         if compose_button:
                             self.is_logged_in = True
-                            cookies = await self.context.cookies()
-                            Path(self.cookies_file).write_text(json.dumps(cookies, indent=2))
+                            await self._save_cookies()
                             self.logger.info("Successfully logged in to Twitter")
                             return True
                     except:
@@ -502,8 +719,7 @@ class PlaywrightScraper:
                     self.logger.warning("Logged in but couldn't verify home page - proceeding anyway")
                     self.is_logged_in = True
                     try:
-                        cookies = await self.context.cookies()
-                        Path(self.cookies_file).write_text(json.dumps(cookies, indent=2))
+                        cookies = await self._save_cookies()
                         self.logger.info(f"Saved {len(cookies)} cookies to {self.cookies_file}")
                     except:
                         pass
@@ -527,14 +743,8 @@ class PlaywrightScraper:
             raise RuntimeError("Browser not initialized")
             
         try:
-            self.current_username = username
-            self.start_time = time.time()
-            self.scraped_tweet_ids.clear()
-            self.all_tweets.clear()
-            self.user_data = None
-            self.max_tweets_per_session = max_tweets_per_session
-            self.existing_tweet_ids = existing_tweet_ids or set()  
-            
+            self._prepare_scraping_session(username, max_tweets_per_session, existing_tweet_ids)
+
             if resume_from_tweet_id:
                 limit_info = f" (limit: {max_tweets_per_session} tweets)" if max_tweets_per_session else " (unlimited)"
                 self.logger.info(f"Resuming scrape for @{username} from tweet {resume_from_tweet_id}{limit_info}")
@@ -561,7 +771,7 @@ class PlaywrightScraper:
             
             
             try:
-                await self.page.wait_for_selector('[data-testid="tweet"]', timeout=self.timeouts['button_click_timeout'])
+                await self.page.wait_for_selector(TWEET_SELECTOR, timeout=self.timeouts['button_click_timeout'])
             except:
                 self.logger.warning("No tweets found or page didn't load properly")
             
@@ -589,12 +799,31 @@ class PlaywrightScraper:
         if username:
             self.current_username = username
         self.start_time = time.time()
-        self.scraped_tweet_ids.clear()
         self.all_tweets.clear()
         self.user_data = None
         self.max_tweets_per_session = max_tweets
-        self.existing_tweet_ids = existing_tweet_ids or set()
-    
+        self.existing_tweet_ids = existing_tweet_ids if existing_tweet_ids is not None else _EMPTY_FROZEN
+        # Pre-seed the session's seen-set with the checkpoint IDs so the
+        # parser needs only a single membership check per tweet.
+        self.scraped_tweet_ids.clear()
+        self.scraped_tweet_ids.update(self.existing_tweet_ids)
+        self._session_counters = {'overlap': 0}
+        self._overlap_ids = set()
+        # For big backfills a Bloom filter front-ends the overlap lookups:
+        # its bit array stays cache-resident where a multi-hundred-thousand
+        # entry str set does not. The exact set remains the authority, so
+        # false positives only cost one confirming lookup.
+        if username:
+            self._open_journal(username)
+        else:
+            self._close_journal()
+        self._existing_bloom = None
+        if ScalableBloomFilter is not None and len(self.existing_tweet_ids) > _BLOOM_THRESHOLD:
+            bloom = ScalableBloomFilter(initial_capacity=100_000, error_rate=0.001)
+            for tweet_id in self.existing_tweet_ids:
+                bloom.add(tweet_id)
+            self._existing_bloom = bloom
+
     @retry_on_network_error(max_retries=3, delay=10.0, exceptions=(Exception,))
     async def _navigate_with_retry(self, url: str, max_retries: int = 3) -> bool:
         if not self.page:
@@ -618,15 +847,18 @@ class PlaywrightScraper:
             
         timeout = timeout or self.timeouts['button_click_timeout']
         try:
-            await self.page.wait_for_selector('[data-testid="tweet"]', timeout=timeout)
+            await self.page.wait_for_selector(TWEET_SELECTOR, timeout=timeout)
             self.logger.info("Search results loaded successfully")
             return True
         except Exception:
             self.logger.warning("No tweets found in search results")
             return False
     
-    def _build_search_url(self, username: Optional[str] = None, since_date: Optional[str] = None, until_date: Optional[str] = None, query: Optional[str] = None, result_type: str = "live") -> str:
-        
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _build_search_url(username: Optional[str] = None, since_date: Optional[str] = None, until_date: Optional[str] = None, query: Optional[str] = None, result_type: str = "live") -> str:
+        # Pure string work on hashable args, so retries and parallel shards
+        # reuse the encoded URL instead of re-quoting it.
         if query:
             search_query = query
         elif username and since_date and until_date:
@@ -635,16 +867,43 @@ class PlaywrightScraper:
             search_query = f"from:{username}"
         else:
             raise ValueError("Must provide either query or username")
-        
+
         encoded_query = urllib.parse.quote(search_query)
         return f"https://twitter.com/search?q={encoded_query}&src=typed_query&f={result_type}"
     
-    async def scrape_user_tweets_by_search(self, username: str, since_date: str, until_date: str, 
+    async def scrape_user_tweets_by_search(self, username: str, since_date: str, until_date: str,
                                            max_tweets_per_range: Optional[int] = None,
                                            existing_tweet_ids: Optional[set] = None) -> Dict[str, Any]:
+        key = hashlib.sha1(f"{username}|{since_date}|{until_date}".encode()).hexdigest()
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.logger.info(f"Coalescing duplicate search scrape for @{username} {since_date}..{until_date}")
+            return await inflight
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._scrape_user_tweets_by_search(
+                username, since_date, until_date, max_tweets_per_range, existing_tweet_ids)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            # The original caller gets the re-raised exception below, not
+            # the future's copy; retrieving it here keeps asyncio from
+            # logging "Future exception was never retrieved" at GC time
+            # when no coalesced awaiter exists.
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _scrape_user_tweets_by_search(self, username: str, since_date: str, until_date: str,
+                                            max_tweets_per_range: Optional[int] = None,
+                                            existing_tweet_ids: Optional[set] = None) -> Dict[str, Any]:
         if not self.page:
             raise RuntimeError("Browser not initialized")
-            
+
         try:
             self._prepare_scraping_session(username, max_tweets_per_range, existing_tweet_ids)
             
@@ -689,12 +948,145 @@ class PlaywrightScraper:
                 'date_range': {'since': since_date, 'until': until_date}
             }
     
+    async def scrape_user_tweets_by_search_parallel(self, username: str, since_date: str, until_date: str,
+                                                    shards: int = 4,
+                                                    max_tweets_per_range: Optional[int] = None,
+                                                    existing_tweet_ids: Optional[set] = None) -> Dict[str, Any]:
+        """Scrape a date range split across concurrent browser contexts.
+
+        The since/until window is chunked into `shards` sub-ranges, each run
+        in its own context+page against the same browser. Shards collect into
+        local lists and dedupe through the shared session seen-set, so a
+        tweet straddling a boundary is only kept once.
+        """
+        if not self.browser:
+            raise RuntimeError("Browser not initialized")
+
+        try:
+            self._prepare_scraping_session(username, max_tweets_per_range, existing_tweet_ids)
+
+            start = datetime.strptime(since_date, '%Y-%m-%d')
+            end = datetime.strptime(until_date, '%Y-%m-%d')
+            span_days = max((end - start).days, 1)
+            shards = max(1, min(shards, span_days))
+            step = (end - start) / shards
+            ranges = []
+            for i in range(shards):
+                lo = (start + step * i).strftime('%Y-%m-%d')
+                hi = until_date if i == shards - 1 else (start + step * (i + 1)).strftime('%Y-%m-%d')
+                ranges.append((lo, hi))
+
+            self.logger.info(f"Starting PARALLEL search scrape for @{username}")
+            self.logger.info(f"   Date range: {since_date} to {until_date} in {shards} shards")
+
+            cookies_data = None
+            if Path(self.cookies_file).exists():
+                try:
+                    cookies_data = self._load_cookies()
+                except Exception as e:
+                    self.logger.warning(f"Failed to load cookies for shards: {e}")
+
+            if self._context_pool is None:
+                self._context_pool = BrowserContextPool(
+                    self.browser,
+                    {
+                        'viewport': {'width': 1920, 'height': 1080},
+                        'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                        'locale': 'en-US',
+                        'timezone_id': 'America/New_York'
+                    },
+                    cookies=cookies_data,
+                    route_handler=self._filter_route
+                )
+
+            semaphore = asyncio.Semaphore(shards)
+            shared_ids = self.scraped_tweet_ids
+
+            async def run_shard(lo: str, hi: str) -> list:
+                async with semaphore:
+                    async with self._context_pool.lease() as context:
+                        shard_tweets: list = []
+                        page = await context.new_page()
+
+                        async def on_response(response: Response):
+                            url = response.url
+                            if not _is_api_url(url):
+                                return
+                            qmark = url.find('?')
+                            path_end = qmark if qmark != -1 else len(url)
+                            op = url[url.rfind('/', 0, path_end) + 1:path_end]
+                            if op not in ('UserTweets', 'SearchTimeline', 'SearchAdaptive'):
+                                return
+                            try:
+                                body = await response.body()
+                                if len(body) < _INLINE_DECODE_LIMIT:
+                                    data = _json_loads(body)
+                                else:
+                                    data = await asyncio.to_thread(_json_loads, body)
+                                _tweet_extract.parse_tweets_from_timeline(data, shared_ids, shard_tweets)
+                            except Exception as e:
+                                self.logger.debug(f"Shard parse error: {e}")
+
+                        page.on("response", on_response)
+
+                        search_url = self._build_search_url(username=username, since_date=lo, until_date=hi)
+                        await page.goto(search_url,
+                                        wait_until='domcontentloaded',
+                                        timeout=self.timeouts['page_load_timeout'])
+                        await asyncio.sleep(self.timeouts['post_navigation_delay'])
+
+                        attempts = 0
+                        without_new = 0
+                        while attempts < self.max_scroll_attempts and without_new < self.max_attempts_without_new:
+                            attempts += 1
+                            before = len(shard_tweets)
+                            page_state = await page.evaluate(_SCROLL_STEP_JS)
+                            await asyncio.sleep(random.uniform(self.scroll_delay_min, self.scroll_delay_max))
+                            if len(shard_tweets) == before:
+                                without_new += 1
+                                if page_state['atBottom'] and without_new > 10:
+                                    break
+                            else:
+                                without_new = 0
+                            if max_tweets_per_range and len(shard_tweets) >= max_tweets_per_range:
+                                break
+
+                        self.logger.info(f"Shard {lo}..{hi}: {len(shard_tweets)} tweets in {attempts} scrolls")
+                    return shard_tweets
+
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(run_shard(lo, hi)) for lo, hi in ranges]
+
+            for task in tasks:
+                self.all_tweets.extend(task.result())
+
+            elapsed_time: float = time.time() - (self.start_time or 0)
+            self.logger.info(f"Parallel search completed in {elapsed_time:.1f}s")
+            self.logger.info(f"Total tweets collected from {since_date} to {until_date}: {len(self.all_tweets)}")
+
+            return {
+                'username': username,
+                'user_data': self.user_data,
+                'tweets': self.all_tweets,
+                'tweet_count': len(self.all_tweets),
+                'elapsed_time': elapsed_time,
+                'date_range': {'since': since_date, 'until': until_date}
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error in parallel search scraping: {e}")
+            return {
+                'error': str(e),
+                'tweets': self.all_tweets,
+                'date_range': {'since': since_date, 'until': until_date}
+            }
+
     async def search_tweets(self, query: str, max_tweets: Optional[int] = None, result_type: str = "Latest") -> Dict[str, Any]:
         if not self.page:
             raise RuntimeError("Browser not initialized")
             
         try:
-            self._prepare_scraping_session(username=None, max_tweets=max_tweets, existing_tweet_ids=set())
+            self._prepare_scraping_session(username=None, max_tweets=max_tweets, existing_tweet_ids=None)
             
             result_type_map = {
                 "Latest": "live",
@@ -719,7 +1111,7 @@ class PlaywrightScraper:
                     'elapsed_time': 0
                 }
             
-            await self._scroll_timeline(resume_from_tweet_id=None, existing_tweet_ids=set())
+            await self._scroll_timeline(resume_from_tweet_id=None, existing_tweet_ids=None)
             
             elapsed_time: float = time.time() - (self.start_time or 0)
             self.logger.info(f"Search completed in {elapsed_time:.1f}s")
@@ -750,78 +1142,124 @@ class PlaywrightScraper:
         scroll_attempts = 0
         self.scroll_attempts_without_new = 0
         resume_point_found = False if resume_from_tweet_id else True
-        existing_tweet_ids = existing_tweet_ids or set() 
-        
+        if existing_tweet_ids is None:
+            existing_tweet_ids = _EMPTY_FROZEN
+
+        # Hoisted out of the loop: these don't change across iterations.
+        session_limit = self.max_tweets_per_session
+        check_overlap = bool(resume_from_tweet_id and existing_tweet_ids)
+        start_time = self.start_time
+        # While searching for the resume point the parser runs in ids-only
+        # mode - progress is measured by seen-set growth, not appended tweets.
+        self._ids_only_phase = check_overlap and not resume_point_found
+
         while scroll_attempts < self.max_scroll_attempts:
             scroll_attempts += 1
-            tweets_before = len(self.all_tweets)
-            
-            
-            await self.page.evaluate('window.scrollBy(0, window.innerHeight * 0.8)')
-            
-            
-            delay = random.uniform(self.scroll_delay_min, self.scroll_delay_max)
-            await asyncio.sleep(delay)
+            if self._ids_only_phase:
+                tweets_before = len(self.scraped_tweet_ids)
+            else:
+                tweets_before = len(self.all_tweets)
             
             
-            tweets_after = len(self.all_tweets)
+            if self._new_content_event is not None:
+                self._new_content_event.clear()
+
+            page_state = await self.page.evaluate(_SCROLL_STEP_JS)
+
+            # Wait for new tweet nodes instead of sleeping a blind fixed
+            # interval: resume as soon as content lands, back off only when
+            # nothing arrives within the window. The MutationObserver push
+            # signal avoids even the DOM polling when available.
+            try:
+                if self._new_content_event is not None:
+                    await asyncio.wait_for(
+                        self._new_content_event.wait(),
+                        timeout=self.scroll_delay_max
+                    )
+                else:
+                    await self.page.wait_for_function(
+                        _TWEET_COUNT_GROWS_JS,
+                        arg=page_state['domTweets'],
+                        timeout=int(self.scroll_delay_max * 1000)
+                    )
+                await asyncio.sleep(self.scroll_delay_min)
+            except Exception:
+                backoff = min(
+                    self.scroll_delay_min * (2 ** min(self.scroll_attempts_without_new, 3)),
+                    self.scroll_delay_max
+                )
+                await asyncio.sleep(backoff)
+
+
+
+            now = time.time()
+            if self._ids_only_phase:
+                tweets_after = len(self.scraped_tweet_ids)
+            else:
+                tweets_after = len(self.all_tweets)
             new_tweets = tweets_after - tweets_before
-            
-            
-            if resume_from_tweet_id and not resume_point_found and existing_tweet_ids:
-                overlap_count = sum(1 for tweet in self.all_tweets if tweet.get('id') in existing_tweet_ids)
-                
-                if overlap_count >= self.overlap_threshold:  
+
+
+            if check_overlap and not resume_point_found:
+                # Maintained incrementally by the parser; replaces an O(N)
+                # rescan of all_tweets on every scroll.
+                overlap_count = self._session_counters['overlap']
+
+                if overlap_count >= self.overlap_threshold:
                     resume_point_found = True
                     self.logger.info(f"Found overlap zone! Detected {overlap_count} existing tweets")
                     self.logger.info(f"   Clearing {len(self.all_tweets)} tweets (duplicates + recent)...")
                     self.logger.info(f"   Now collecting OLDER tweets (before previous session)...")
-                    
+
                     self.all_tweets.clear()
                     self.scraped_tweet_ids.clear()
-                    
+                    self.scraped_tweet_ids.update(existing_tweet_ids)
+                    self._session_counters['overlap'] = 0
+                    self._overlap_ids.clear()
+                    self._ids_only_phase = False
+                    self._truncate_journal()
+
                     tweets_before = 0
                     tweets_after = 0
                     new_tweets = 0
                     self.scroll_attempts_without_new = 0
             
             if new_tweets > 0:
+                # %-style args defer formatting until the record is accepted,
+                # so a filtered INFO level costs nothing here.
                 if not resume_point_found:
-                    self.logger.info(f"Scrolling to resume point... ({tweets_after} tweets checked)")
+                    self.logger.info("Scrolling to resume point... (%d tweets checked)",
+                                     tweets_after - len(existing_tweet_ids))
+                elif session_limit:
+                    self.logger.info("Scroll %d: +%d NEW tweets (total: %d/%d, %.1f%%)",
+                                     scroll_attempts, new_tweets, tweets_after, session_limit,
+                                     (tweets_after / session_limit) * 100)
                 else:
-                    if self.max_tweets_per_session:
-                        progress_pct = (tweets_after / self.max_tweets_per_session) * 100
-                        self.logger.info(f"Scroll {scroll_attempts}: +{new_tweets} NEW tweets (total: {tweets_after}/{self.max_tweets_per_session}, {progress_pct:.1f}%)")
-                    else:
-                        self.logger.info(f"Scroll {scroll_attempts}: +{new_tweets} NEW tweets (total: {tweets_after})")
+                    self.logger.info("Scroll %d: +%d NEW tweets (total: %d)",
+                                     scroll_attempts, new_tweets, tweets_after)
                 self.scroll_attempts_without_new = 0
             else:
                 self.scroll_attempts_without_new += 1
-                
-                if scroll_attempts >= 20 and len(self.all_tweets) == 0:
+
+                if scroll_attempts >= 20 and tweets_after == 0:
                     self.logger.error("Scrolled 20 times with 0 tweets extracted - tweet parsing is broken!")
                     self.logger.error("   Check the debug logs for skipped entry IDs")
                     break
-                
+
                 if not resume_point_found and self.scroll_attempts_without_new >= 100:
-                    self.logger.warning(f"Scrolled 100 times without finding resume point - might not exist")
+                    self.logger.warning("Scrolled 100 times without finding resume point - might not exist")
                     break
                 elif resume_point_found and self.scroll_attempts_without_new >= self.max_attempts_without_new:
-                    self.logger.info(f"No new tweets for {self.max_attempts_without_new} scrolls - stopping")
+                    self.logger.info("No new tweets for %d scrolls - stopping", self.max_attempts_without_new)
                     break
-            
-            if resume_point_found and self.max_tweets_per_session and len(self.all_tweets) >= self.max_tweets_per_session:
-                self.logger.info(f"Session limit reached: {len(self.all_tweets)}/{self.max_tweets_per_session} tweets")
-                self.logger.info(f"   Use resume in next session to continue from where we left off!")
+
+            if resume_point_found and session_limit and tweets_after >= session_limit:
+                self.logger.info("Session limit reached: %d/%d tweets", tweets_after, session_limit)
+                self.logger.info("   Use resume in next session to continue from where we left off!")
                 break
             
             
-            is_at_bottom = await self.page.evaluate('''
-                () => {
-                    return window.innerHeight + window.scrollY >= document.body.scrollHeight - 100;
-                }
-            ''')
-            
+            is_at_bottom = page_state['atBottom']
 
             if is_at_bottom and self.scroll_attempts_without_new > 10:
                 self.logger.info("Reached bottom of timeline and no new tweets - stopping")
@@ -837,18 +1275,18 @@ class PlaywrightScraper:
             
             
             if scroll_attempts % 50 == 0:
-                elapsed = (time.time() - self.start_time) if self.start_time is not None else 0
+                elapsed = (now - start_time) if start_time is not None else 0
                 rate = len(self.all_tweets) / elapsed if elapsed > 0 else 0
-                self.logger.info(f"Progress: {len(self.all_tweets)} tweets in {elapsed:.0f}s ({rate:.1f} tweets/s)")
-                
-            if self.start_time is not None:
-                elapsed_time: float = time.time() - self.start_time
-                if elapsed_time > 600 and len(self.all_tweets) == 0:
+                self.logger.info("Progress: %d tweets in %.0fs (%.1f tweets/s)",
+                                 len(self.all_tweets), elapsed, rate)
+
+            if start_time is not None and not self._ids_only_phase:
+                if now - start_time > 600 and len(self.all_tweets) == 0:
                     self.logger.error("Been scrolling for 10 minutes with 0 tweets - stopping to prevent crash")
                     self.logger.error("   This usually means tweet extraction is broken")
                     break
-        
-        self.logger.info(f"Scrolling completed after {scroll_attempts} attempts")
+
+        self.logger.info("Scrolling completed after %d attempts", scroll_attempts)
     
     def _save_final_tweets(self, username: str):    
         if not self.all_tweets:
@@ -857,10 +1295,11 @@ class PlaywrightScraper:
         
         try:
             data_dir = Path(f"data/{username}")
-            data_dir.mkdir(parents=True, exist_ok=True)
-            
-            
-            filename = data_dir / f"tweets_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            if username not in self._ensured_dirs:
+                data_dir.mkdir(parents=True, exist_ok=True)
+                self._ensured_dirs.add(username)
+
+            filename = data_dir / f"tweets_{time.strftime('%Y%m%d_%H%M%S')}.json"
             
             output_data = {
                 'username': username,
@@ -871,8 +1310,8 @@ class PlaywrightScraper:
                 'tweets': self.all_tweets
             }
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False, default=str)
+            with open(filename, 'wb') as f:
+                f.write(_json_dump_bytes(output_data))
             
             self.logger.info(f"Saved {len(self.all_tweets)} tweets to {filename}")
             
@@ -881,11 +1320,24 @@ class PlaywrightScraper:
     
     async def cleanup(self):
         try:
+            self._close_journal()
             if self.page:
                 await self.page.close()
+            if self._context_pool:
+                await self._context_pool.close()
+                self._context_pool = None
             if self.context:
+                try:
+                    # Warm the next process: storage_state carries cookies and
+                    # local storage, so a fresh run can skip the login dance.
+                    await self.context.storage_state(path="playwright_state.json")
+                except Exception as e:
+                    self.logger.debug(f"Could not persist storage state: {e}")
                 await self.context.close()
             if self.browser:
+                for key, pair in list(self._browser_cache.items()):
+                    if pair[1] is self.browser:
+                        del self._browser_cache[key]
                 await self.browser.close()
             if self.playwright:
                 await self.playwright.stop()
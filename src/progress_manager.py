@@ -1,15 +1,30 @@
 import json
 import logging
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
+try:
+    import orjson  # type: ignore
+    _loads = orjson.loads
 
-@dataclass
+    def _dump_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    orjson = None  # type: ignore
+    _loads = json.loads
+
+    def _dump_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+
+@dataclass(slots=True)
 class ScrapingProgress:
-    target_type: str 
-    target_value: str 
+    target_type: str
+    target_value: str
     total_requested: int
     total_scraped: int
     last_tweet_id: Optional[str]
@@ -18,9 +33,22 @@ class ScrapingProgress:
     last_update: float
     accounts_used: List[str]
     completed: bool
-    
+
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Shallow explicit build; asdict deep-copies accounts_used on every
+        # save, which adds up when progress is persisted per batch.
+        return {
+            "target_type": self.target_type,
+            "target_value": self.target_value,
+            "total_requested": self.total_requested,
+            "total_scraped": self.total_scraped,
+            "last_tweet_id": self.last_tweet_id,
+            "last_cursor": self.last_cursor,
+            "start_time": self.start_time,
+            "last_update": self.last_update,
+            "accounts_used": self.accounts_used,
+            "completed": self.completed,
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ScrapingProgress':
@@ -35,7 +63,13 @@ class ProgressManager:
         self.logger = logging.getLogger(__name__)
         
         self.current_progress: Optional[ScrapingProgress] = None
-        
+        # Disk writes are rate-limited; hot updates stay in memory and are
+        # flushed at most once per interval (or on completion/flush()).
+        self._save_interval = 5.0
+        self._last_save_ts = 0.0
+        self._dirty = False
+
+
     def _get_progress_file(self, target_type: str, target_value: str) -> Path:
         clean_target = target_value.replace('@', '').replace(' ', '_').replace('/', '_')
         return self.progress_dir / f"{target_type}_{clean_target}_progress.json"
@@ -47,9 +81,8 @@ class ProgressManager:
             return None
         
         try:
-            with open(progress_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+            data = _loads(progress_file.read_bytes())
+
             progress = ScrapingProgress.from_dict(data)
             self.logger.info(f"Loaded progress: {progress.total_scraped}/{progress.total_requested} tweets")
             return progress
@@ -63,9 +96,17 @@ class ProgressManager:
             progress_file = self._get_progress_file(progress.target_type, progress.target_value)
             progress.last_update = time.time()
             
-            with open(progress_file, 'w', encoding='utf-8') as f:
-                json.dump(progress.to_dict(), f, indent=2)
-            
+            # Write-to-temp + rename so a crash mid-write can never leave a
+            # truncated progress file behind for load_progress to choke on.
+            tmp_file = progress_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(_dump_bytes(progress.to_dict()))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, progress_file)
+
+            self._last_save_ts = time.time()
+            self._dirty = False
             self.logger.debug(f"Progress saved: {progress.total_scraped}/{progress.total_requested}")
             return True
             
@@ -123,8 +164,17 @@ class ProgressManager:
         if self.current_progress.total_scraped >= self.current_progress.total_requested:
             self.current_progress.completed = True
             self.logger.info(f"Scraping completed: {self.current_progress.total_scraped} tweets")
-        
-        return self.save_progress(self.current_progress)
+
+        self._dirty = True
+        if self.current_progress.completed or time.time() - self._last_save_ts > self._save_interval:
+            return self.save_progress(self.current_progress)
+        return True
+
+    def flush(self) -> bool:
+        """Write any progress not yet persisted by the throttled updates."""
+        if self.current_progress and self._dirty:
+            return self.save_progress(self.current_progress)
+        return True
     
     def get_resume_info(self, target_type: str, target_value: str) -> Optional[Dict[str, Any]]:
         progress = self.load_progress(target_type, target_value)
@@ -165,28 +215,38 @@ class ProgressManager:
             self.logger.error(f"Failed to clear progress: {str(e)}")
             return False
     
+    def _read_one_progress(self, progress_file: Path) -> Optional[Dict[str, Any]]:
+        try:
+            data = _loads(progress_file.read_bytes())
+
+            progress = ScrapingProgress.from_dict(data)
+            if not progress.completed:
+                return {
+                    "target_type": progress.target_type,
+                    "target_value": progress.target_value,
+                    "progress": f"{progress.total_scraped}/{progress.total_requested}",
+                    "completion_percentage": (progress.total_scraped / progress.total_requested) * 100,
+                    "last_update": progress.last_update,
+                    "file": str(progress_file)
+                }
+        except Exception as e:
+            self.logger.error(f"Error reading progress file {progress_file}: {str(e)}")
+        return None
+
     def list_incomplete_sessions(self) -> List[Dict[str, Any]]:
-        incomplete = []
-        
-        for progress_file in self.progress_dir.glob("*_progress.json"):
-            try:
-                with open(progress_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                progress = ScrapingProgress.from_dict(data)
-                if not progress.completed:
-                    incomplete.append({
-                        "target_type": progress.target_type,
-                        "target_value": progress.target_value,
-                        "progress": f"{progress.total_scraped}/{progress.total_requested}",
-                        "completion_percentage": (progress.total_scraped / progress.total_requested) * 100,
-                        "last_update": progress.last_update,
-                        "file": str(progress_file)
-                    })
-            except Exception as e:
-                self.logger.error(f"Error reading progress file {progress_file}: {str(e)}")
-        
-        return incomplete
+        files = list(self.progress_dir.glob("*_progress.json"))
+        if not files:
+            return []
+
+        # With many progress files the cost is disk I/O, which threads
+        # overlap nicely; a single file skips the pool entirely.
+        if len(files) == 1:
+            results = [self._read_one_progress(files[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(16, len(files))) as executor:
+                results = list(executor.map(self._read_one_progress, files))
+
+        return [entry for entry in results if entry is not None]
     
     def get_current_progress(self) -> Optional[ScrapingProgress]:
         return self.current_progress
\ No newline at end of file
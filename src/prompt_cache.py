@@ -0,0 +1,189 @@
+"""Persistent LLM response cache keyed by the rendered prompt.
+
+The analysis prompts are deterministic functions of their inputs, and the
+same tweet batches are frequently re-analyzed across scraping runs. Caching
+the model's response against a hash of (rendered prompt, model, sampling
+params) turns a 1-10 s LLM round-trip into a local lookup on repeat batches.
+
+Backed by a small sqlite database so hits survive process restarts; the
+in-memory dict cache in AIAnalyzer remains the first-level cache within a
+single run. Sampling parameters that change the output (model, temperature,
+top_p, seed) are part of the key; transport details (streaming, api keys)
+are not.
+"""
+import hashlib
+import json
+import logging
+import math
+import re
+import sqlite3
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class LLMCache:
+
+    def __init__(self, db_path: str = ".cache/prompts.db",
+                 max_entries: int = 10_000, ttl: float = 7 * 24 * 3600):
+        self.logger = logging.getLogger(__name__)
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        path = Path(db_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " response BLOB NOT NULL,"
+            " created REAL NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(prompt: str, model: str, temperature: float,
+                 top_p: Optional[float] = None, seed: Optional[int] = None,
+                 system_hash: str = "") -> str:
+        # system_hash fingerprints the system prompt sent alongside the
+        # rendered user prompt, so editing it invalidates old entries.
+        material = f"{model}\x00{temperature}\x00{top_p}\x00{seed}\x00{system_hash}\x00{prompt}"
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            row = self._conn.execute(
+                "SELECT response, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            blob, created = row
+            if time.time() - created > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return json.loads(zlib.decompress(blob))
+        except Exception as e:
+            self.logger.debug(f"Prompt cache read failed: {e}")
+            return None
+
+    def set(self, key: str, response: Dict[str, Any]) -> None:
+        try:
+            blob = zlib.compress(json.dumps(response, default=str).encode('utf-8'))
+            now = time.time()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created, last_used)"
+                " VALUES (?, ?, ?, ?)", (key, blob, now, now)
+            )
+            self._evict()
+            self._conn.commit()
+        except Exception as e:
+            self.logger.debug(f"Prompt cache write failed: {e}")
+
+    def _evict(self) -> None:
+        # LRU eviction: drop the least recently used rows once over capacity.
+        count = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        if count > self.max_entries:
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM responses ORDER BY last_used LIMIT ?)",
+                (count - self.max_entries,)
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {
+            'entries': total,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / (self.hits + self.misses) if (self.hits + self.misses) else 0.0,
+        }
+
+    def close(self) -> None:
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+
+
+def _term_vector(text: str) -> Counter:
+    # Character trigrams rather than words: they keep spelling variants
+    # ("summarise"/"summarize") close without an embedding model.
+    text = ' '.join(text.lower().split())
+    if len(text) <= 3:
+        return Counter((text,)) if text else Counter()
+    return Counter(text[i:i + 3] for i in range(len(text) - 2))
+
+
+def _cosine(a: Counter, b: Counter) -> float:
+    if not a or not b:
+        return 0.0
+    # Iterate the smaller vector for the dot product.
+    if len(a) > len(b):
+        a, b = b, a
+    dot = sum(count * b[term] for term, count in a.items() if term in b)
+    if not dot:
+        return 0.0
+    norm = math.sqrt(sum(c * c for c in a.values())) * math.sqrt(sum(c * c for c in b.values()))
+    return dot / norm
+
+
+class SemanticCache:
+    """Near-duplicate cache for free-form custom analysis prompts.
+
+    Exact hashing misses trivial rewordings of the same request
+    ("summarize themes" vs "summarise the themes"). This layer keeps a
+    bag-of-words vector per cached custom prompt and reuses a prior
+    response when the tweet batch is identical (exact hash) and the
+    prompt's cosine similarity clears the threshold. Trigram vectors stand
+    in for sentence embeddings so the layer has no model dependency, but
+    they score paraphrases lower than embeddings do: short reworded pairs
+    like the one above land around 0.75-0.80 while unrelated prompts stay
+    below 0.25, so the default threshold is 0.72 rather than the 0.90
+    customary in embedding space.
+    """
+
+    def __init__(self, threshold: float = 0.72, max_entries: int = 256):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries: List[Tuple[str, Counter, Dict[str, Any]]] = []
+
+    @staticmethod
+    def tweet_hash(tweet_texts: List[str]) -> str:
+        material = '\x00'.join(tweet_texts[:50])
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def lookup(self, custom_prompt: str, tweet_hash: str) -> Optional[Dict[str, Any]]:
+        query = _term_vector(custom_prompt)
+        best = None
+        best_score = self.threshold
+        # Identical tweet batch is a hard requirement; only the wording of
+        # the custom prompt is allowed to vary.
+        for entry_hash, vector, response in self._entries:
+            if entry_hash != tweet_hash:
+                continue
+            score = _cosine(query, vector)
+            if score >= best_score:
+                best = response
+                best_score = score
+        return best
+
+    def store(self, custom_prompt: str, tweet_hash: str, response: Dict[str, Any]) -> None:
+        self._entries.append((tweet_hash, _term_vector(custom_prompt), response))
+        if len(self._entries) > self.max_entries:
+            del self._entries[0]
@@ -1,24 +1,232 @@
-from typing import List, Dict, Any
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
+import hashlib
+import io
 import json
+import logging
+import os
+import sys
 
+logger = logging.getLogger(__name__)
 
-class AnalysisPrompts:
-    
-    @staticmethod
-    def sentiment_analysis(tweet_texts: List[str]) -> str:
-        return f"""
-        Analyze the sentiment of the following {len(tweet_texts)} tweets. 
+# Compact JSON by default: the model does not need pretty-printing, and
+# indent=2 inflates the embedded blob (and thus input tokens) by 30-50%.
+# Set PROMPT_PRETTY=1 to get readable prompts while debugging locally.
+_PROMPT_PRETTY = os.getenv('PROMPT_PRETTY', '').lower() in ('1', 'true', 'yes')
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+
+# Single definitions branching on orjson availability: mypyc rejects the
+# usual duplicate-def-per-import-branch pattern, and the per-call check
+# is a pointer comparison.
+def _dumps(obj: Any) -> str:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if _PROMPT_PRETTY:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option, default=str).decode()
+    if _PROMPT_PRETTY:
+        return json.dumps(obj, indent=2, default=str)
+    return json.dumps(obj, separators=(',', ':'), default=str)
+
+
+def _dump_into(obj: Any, buf: io.StringIO) -> None:
+    if orjson is not None:
+        buf.write(_dumps(obj))
+    elif _PROMPT_PRETTY:
+        # json.dump writes straight into the buffer - true streaming on
+        # the stdlib path.
+        json.dump(obj, buf, indent=2, default=str)
+    else:
+        json.dump(obj, buf, separators=(',', ':'), default=str)
+
+
+# The trend prompt only reasons over timing, engagement counts and hashtags;
+# shipping full tweet text there just burns input tokens.
+_TREND_FIELDS = ('created_at', 'retweet_count', 'favorite_count', 'reply_count', 'hashtags')
+
+
+def _slim_trend(tweet: Dict[str, Any]) -> Dict[str, Any]:
+    slim = {key: tweet[key] for key in _TREND_FIELDS if key in tweet}
+    text = tweet.get('text')
+    if text is not None:
+        slim['text_length'] = len(text)
+    return slim
+
+
+def _aos_to_soa(records: List[Dict[str, Any]]) -> Dict[str, list]:
+    """Transpose row dicts into aligned columns (AoS -> SoA).
+
+    Serializing columns repeats each key name once instead of once per
+    record, which is the bulk of the token cost for wide row dicts.
+    Missing keys become None so the arrays stay index-aligned.
+    """
+    if not records:
+        return {}
+    keys = list(dict.fromkeys(key for record in records for key in record))
+    return {key: [record.get(key) for record in records] for key in keys}
+
+
+_SYSTEM_PROMPT = sys.intern("""You are an expert social media analyst specializing in Twitter/X data analysis.
+
+        Your expertise includes:
+        - Sentiment analysis and emotional intelligence
+        - Topic modeling and trend identification
+        - Social media engagement optimization
+        - Content classification and categorization
+        - Named entity recognition and relationship mapping
+        - Viral content pattern recognition
+        - Audience behavior analysis
+
+        Guidelines for your analysis:
+        1. Always provide data-driven insights backed by evidence from the tweets
+        2. Use quantitative metrics whenever possible (percentages, scores, counts)
+        3. Identify actionable patterns that can inform strategy
+        4. Consider context, timing, and social dynamics in your analysis
+        5. Highlight both opportunities and risks in your findings
+        6. Provide clear, structured responses in valid JSON format
+        7. Include confidence scores for subjective assessments
+        8. Explain your reasoning for key insights
+
+        Respond with detailed, accurate analysis that provides real value for social media strategy and understanding.""")
+# Hashed once at import; response-cache keys embed this so entries are
+# invalidated when the system prompt changes between releases, without
+# re-hashing the full text on every request.
+_SYSTEM_PROMPT_HASH = hashlib.sha256(_SYSTEM_PROMPT.encode()).hexdigest()
+
+
+# Per-section building blocks for combined_analysis: the numbered tweet
+# block dominates prompt tokens, so asking for several analyses in one
+# request embeds it once instead of once per analysis. Each section has an
+# instruction line and a compact response-schema fragment keyed under its
+# name in the merged output object.
+_SECTION_INSTRUCTIONS = {
+    'sentiment': '- sentiment: overall sentiment distribution (positive/negative/neutral percentages), per-tweet sentiments with confidence, key emotional themes',
+    'topics': '- topics: top discussed topics with frequency scores and keywords, emerging themes, trending hashtags',
+    'summary': '- summary: executive summary, main themes, key insights, notable quotes, conclusion',
+    'classification': '- classification: category distribution with percentages, per-tweet primary category with confidence',
+    'entities': '- entities: people, organizations, locations and other named entities with frequency and sentiment',
+}
+
+_SECTION_SCHEMAS = {
+    'sentiment': '"sentiment": {"overall_sentiment": {"positive": 0, "negative": 0, "neutral": 0}, "individual_sentiments": [{"tweet_index": 1, "sentiment": "positive", "confidence": 0.9}], "emotional_themes": []}',
+    'topics': '"topics": {"top_topics": [{"topic": "name", "frequency": 0.25, "keywords": []}], "emerging_themes": [], "trending_hashtags": []}',
+    'summary': '"summary": {"executive_summary": "", "main_themes": [], "key_insights": [], "notable_quotes": [], "conclusion": ""}',
+    'classification': '"classification": {"category_distribution": {"Technology": 0.25}, "individual_classifications": [{"tweet_index": 1, "primary_category": "Technology", "confidence": 0.9}]}',
+    'entities': '"entities": {"people": [], "organizations": [], "locations": [], "products": [], "events": []}',
+}
+
+_COMBINED_TMPL = """
+        Perform the following analyses on the {n} tweets below:
+{instructions}
+
+        Tweets:
+        {tweets}
+
+        Respond with a single JSON object whose top-level keys are exactly
+        the requested analysis names, following this structure:
+        {{
+{schemas}
+        }}
+        """
+
+
+# Classification categories as data: rendered into the default block once at
+# import, and filterable per call so domain-aware callers can shrink the
+# prompt to the categories they actually expect.
+_CATEGORIES = (
+    ("News/Information", "Breaking news, factual updates, informational content"),
+    ("Opinion/Commentary", "Personal views, analysis, editorial content"),
+    ("Personal/Lifestyle", "Personal updates, daily life, experiences"),
+    ("Business/Marketing", "Promotional content, business updates, advertisements"),
+    ("Entertainment", "Humor, memes, celebrity content, pop culture"),
+    ("Technology", "Tech news, product launches, technical discussions"),
+    ("Politics", "Political news, policy discussions, political opinions"),
+    ("Sports", "Sports news, game updates, athlete content"),
+    ("Education", "Educational content, learning resources, academic discussions"),
+    ("Health", "Health tips, medical news, wellness content"),
+    ("Social Issues", "Activism, social causes, community issues"),
+)
+
+_CATEGORY_BLOCK = "\n".join(f"        - {name}: {desc}" for name, desc in _CATEGORIES)
+
+
+# Each fixed template is instruction block + shared tweet-block scaffold +
+# response-schema block, assembled once at import. Keeping instructions and
+# schemas in dicts makes the invariant schema examples swappable (e.g. a
+# compact variant to save tokens) without touching the instruction text.
+# Schema blocks are stored brace-doubled, ready for str.format.
+_INSTR = {
+    'sentiment': """
+        Analyze the sentiment of the following {n} tweets.
         Provide:
         1. Overall sentiment distribution (positive, negative, neutral percentages)
         2. Individual tweet sentiments with confidence scores
         3. Key emotional themes and patterns
         4. Sentiment trends if applicable
         5. Notable emotional indicators (words, phrases, emojis)
-        
-        Tweets:
-        {chr(10).join([f"{i+1}. {text}" for i, text in enumerate(tweet_texts[:50])])}
-        
-        Respond in JSON format with the following structure:
+""",
+    'topics': """
+        Analyze the topics and themes in the following {n} tweets.
+        Provide:
+        1. Top 10 most discussed topics with frequency scores
+        2. Topic categories and subcategories
+        3. Emerging themes and trending topics
+        4. Topic clusters and relationships
+        5. Hashtag analysis and keyword extraction
+""",
+    'summary': """
+        Create a comprehensive summary of the following {n} tweets.
+        Include:
+        1. Main themes and topics discussed
+        2. Key insights and takeaways
+        3. Notable quotes or statements (with attribution)
+        4. Overall narrative or story arc
+        5. Actionable insights and recommendations
+        6. Timeline of events if applicable
+""",
+    'classification': """
+        Classify the following {n} tweets into relevant categories.
+
+        Primary categories include:
+{categories}
+
+        Provide:
+        1. Category distribution with percentages
+        2. Individual tweet classifications with confidence scores
+        3. Subcategory analysis where applicable
+        4. Content quality assessment
+        5. Engagement potential by category
+""",
+    'entities': """
+        Extract and analyze named entities from the following {n} tweets.
+
+        Entity types to identify:
+        1. People: Names, usernames, public figures, influencers
+        2. Organizations: Companies, institutions, government bodies
+        3. Locations: Cities, countries, places, venues
+        4. Products/Services: Brand names, product mentions, services
+        5. Events: Conferences, meetings, launches, incidents
+        6. Hashtags and mentions: Social media specific entities
+        7. Dates/Times: Temporal references
+        8. Money/Numbers: Financial figures, statistics
+
+        Provide:
+        - Entity frequency counts and importance scores
+        - Entity types and detailed categories
+        - Relationship networks between entities
+        - Most influential entities and their impact
+        - Sentiment associated with each entity
+""",
+}
+
+_SCHEMAS = {
+    'sentiment': """        Respond in JSON format with the following structure:
         {{
             "overall_sentiment": {{
                 "positive": percentage,
@@ -36,23 +244,8 @@ class AnalysisPrompts:
             }},
             "insights": "Overall sentiment analysis insights"
         }}
-        """
-    
-    @staticmethod
-    def topic_analysis(tweet_texts: List[str]) -> str:
-        return f"""
-        Analyze the topics and themes in the following {len(tweet_texts)} tweets.
-        Provide:
-        1. Top 10 most discussed topics with frequency scores
-        2. Topic categories and subcategories
-        3. Emerging themes and trending topics
-        4. Topic clusters and relationships
-        5. Hashtag analysis and keyword extraction
-        
-        Tweets:
-        {chr(10).join([f"{i+1}. {text}" for i, text in enumerate(tweet_texts[:50])])}
-        
-        Respond in JSON format with structured topic data:
+        """,
+    'topics': """        Respond in JSON format with structured topic data:
         {{
             "top_topics": [
                 {{"topic": "topic_name", "frequency": 0.25, "keywords": ["key1", "key2"], "category": "category_name"}}
@@ -71,24 +264,8 @@ class AnalysisPrompts:
             }},
             "insights": "Key insights about topic distribution and trends"
         }}
-        """
-    
-    @staticmethod
-    def summary_generation(tweet_texts: List[str]) -> str:
-        return f"""
-        Create a comprehensive summary of the following {len(tweet_texts)} tweets.
-        Include:
-        1. Main themes and topics discussed
-        2. Key insights and takeaways
-        3. Notable quotes or statements (with attribution)
-        4. Overall narrative or story arc
-        5. Actionable insights and recommendations
-        6. Timeline of events if applicable
-        
-        Tweets:
-        {chr(10).join([f"{i+1}. {text}" for i, text in enumerate(tweet_texts[:50])])}
-        
-        Provide a well-structured summary in JSON format:
+        """,
+    'summary': """        Provide a well-structured summary in JSON format:
         {{
             "executive_summary": "Brief overview of the main points",
             "main_themes": ["theme1", "theme2", "theme3"],
@@ -107,37 +284,8 @@ class AnalysisPrompts:
             ],
             "conclusion": "Final thoughts and implications"
         }}
-        """
-    
-    @staticmethod
-    def classification_analysis(tweet_texts: List[str]) -> str:
-        return f"""
-        Classify the following {len(tweet_texts)} tweets into relevant categories.
-        
-        Primary categories include:
-        - News/Information: Breaking news, factual updates, informational content
-        - Opinion/Commentary: Personal views, analysis, editorial content
-        - Personal/Lifestyle: Personal updates, daily life, experiences
-        - Business/Marketing: Promotional content, business updates, advertisements
-        - Entertainment: Humor, memes, celebrity content, pop culture
-        - Technology: Tech news, product launches, technical discussions
-        - Politics: Political news, policy discussions, political opinions
-        - Sports: Sports news, game updates, athlete content
-        - Education: Educational content, learning resources, academic discussions
-        - Health: Health tips, medical news, wellness content
-        - Social Issues: Activism, social causes, community issues
-        
-        Provide:
-        1. Category distribution with percentages
-        2. Individual tweet classifications with confidence scores
-        3. Subcategory analysis where applicable
-        4. Content quality assessment
-        5. Engagement potential by category
-        
-        Tweets:
-        {chr(10).join([f"{i+1}. {text}" for i, text in enumerate(tweet_texts[:50])])}
-        
-        Respond in JSON format:
+        """,
+    'classification': """        Respond in JSON format:
         {{
             "category_distribution": {{
                 "News/Information": 0.25,
@@ -164,34 +312,8 @@ class AnalysisPrompts:
             }},
             "insights": "Key patterns in content categorization"
         }}
-        """
-    
-    @staticmethod
-    def entity_extraction(tweet_texts: List[str]) -> str:
-        return f"""
-        Extract and analyze named entities from the following {len(tweet_texts)} tweets.
-        
-        Entity types to identify:
-        1. People: Names, usernames, public figures, influencers
-        2. Organizations: Companies, institutions, government bodies
-        3. Locations: Cities, countries, places, venues
-        4. Products/Services: Brand names, product mentions, services
-        5. Events: Conferences, meetings, launches, incidents
-        6. Hashtags and mentions: Social media specific entities
-        7. Dates/Times: Temporal references
-        8. Money/Numbers: Financial figures, statistics
-        
-        Provide:
-        - Entity frequency counts and importance scores
-        - Entity types and detailed categories
-        - Relationship networks between entities
-        - Most influential entities and their impact
-        - Sentiment associated with each entity
-        
-        Tweets:
-        {chr(10).join([f"{i+1}. {text}" for i, text in enumerate(tweet_texts[:50])])}
-        
-        Respond in JSON format with structured entity data:
+        """,
+    'entities': """        Respond in JSON format with structured entity data:
         {{
             "entities_by_type": {{
                 "people": [
@@ -219,14 +341,57 @@ class AnalysisPrompts:
             ],
             "insights": "Key patterns in entity mentions and relationships"
         }}
+        """,
+}
+
+_TWEET_BLOCK = '\n        Tweets:\n        {tweets}\n\n'
+
+_TMPLS = {name: _INSTR[name] + _TWEET_BLOCK + _SCHEMAS[name] for name in _INSTR}
+_CUSTOM_TMPL = """
+        {custom_prompt}
+
+        Analyze the following {n} tweets according to the above requirements:
+        {tweets}
+
+        Respond in JSON format with structured results that address the specific analysis requested.
+        Ensure your response includes:
+        1. Clear categorization of findings
+        2. Quantitative metrics where applicable
+        3. Qualitative insights and interpretations
+        4. Actionable recommendations
+        5. Supporting evidence from the tweet data
+
+        Structure your response as:
+        {{
+            "analysis_type": "custom_analysis",
+            "findings": {{
+                "key_metrics": {{}},
+                "patterns": [],
+                "insights": []
+            }},
+            "recommendations": [],
+            "supporting_evidence": [],
+            "conclusion": "Summary of key findings and implications"
+        }}
         """
-    
-    @staticmethod
-    def trend_analysis(tweet_data: List[Dict[str, Any]]) -> str:
-        return f"""
+
+
+# The trend/engagement prompts wrap a potentially large JSON payload in
+# fixed scaffolding; keeping prefix and suffix as separate constants lets
+# the builders stream all three parts into one buffer instead of holding
+# the serialized payload and the finished prompt as two full copies.
+_TREND_PREFIX = """
         Analyze trends in the following tweet data:
-        {json.dumps(tweet_data, indent=2)}
-        
+        """
+
+_TREND_COLUMNAR_PREFIX = """
+        Analyze trends in the following tweet data. It is given in columnar
+        form: each key maps to an array of per-tweet values, and entry i of
+        every array belongs to the same tweet:
+        """
+
+_TREND_SUFFIX = """
+
         Identify and analyze:
         1. Temporal patterns: Posting times, frequency distributions, peak activity periods
         2. Engagement trends: Likes, retweets, replies patterns and correlations
@@ -235,51 +400,51 @@ class AnalysisPrompts:
         5. Emerging vs declining trends: Rising and falling topics
         6. User behavior patterns: Posting habits, engagement styles
         7. Content performance metrics: Success factors and predictors
-        
+
         Provide insights in JSON format:
-        {{
-            "temporal_patterns": {{
+        {
+            "temporal_patterns": {
                 "peak_hours": ["14:00-16:00", "20:00-22:00"],
                 "peak_days": ["Tuesday", "Wednesday"],
-                "posting_frequency": {{"average_per_hour": 12.5, "trend": "increasing"}}
-            }},
-            "engagement_trends": {{
+                "posting_frequency": {"average_per_hour": 12.5, "trend": "increasing"}
+            },
+            "engagement_trends": {
                 "average_likes": 150,
                 "average_retweets": 25,
                 "engagement_rate": 0.08,
                 "high_performing_content": ["videos", "questions", "controversial topics"]
-            }},
-            "content_trends": {{
+            },
+            "content_trends": {
                 "trending_hashtags": ["#trending1", "#trending2"],
                 "declining_hashtags": ["#declining1"],
                 "emerging_topics": ["topic1", "topic2"],
-                "topic_lifecycle": {{"AI": "mature", "Web3": "declining", "Climate": "emerging"}}
-            }},
-            "viral_patterns": {{
-                "viral_threshold": {{"likes": 1000, "retweets": 100}},
+                "topic_lifecycle": {"AI": "mature", "Web3": "declining", "Climate": "emerging"}
+            },
+            "viral_patterns": {
+                "viral_threshold": {"likes": 1000, "retweets": 100},
                 "viral_factors": ["timing", "controversy", "humor", "breaking_news"],
                 "viral_content_types": ["memes", "breaking_news", "celebrity_mentions"]
-            }},
-            "user_behavior": {{
+            },
+            "user_behavior": {
                 "active_users": 150,
-                "engagement_distribution": {{"high": 0.2, "medium": 0.5, "low": 0.3}},
+                "engagement_distribution": {"high": 0.2, "medium": 0.5, "low": 0.3},
                 "behavior_patterns": ["morning_news_sharing", "evening_entertainment"]
-            }},
-            "predictions": {{
+            },
+            "predictions": {
                 "trending_up": ["topic1", "hashtag1"],
                 "trending_down": ["topic2", "hashtag2"],
                 "next_viral_candidates": ["content_type1", "content_type2"]
-            }},
+            },
             "insights": "Key insights about trending patterns and future predictions"
-        }}
+        }
         """
-    
-    @staticmethod
-    def engagement_analysis(engagement_data: List[Dict[str, Any]]) -> str:
-        return f"""
+
+_ENGAGEMENT_PREFIX = """
         Analyze engagement patterns in the following tweet data:
-        {json.dumps(engagement_data, indent=2)}
-        
+        """
+
+_ENGAGEMENT_SUFFIX = """
+
         Provide comprehensive insights on:
         1. Factors that drive high engagement (likes, retweets, replies)
         2. Optimal content characteristics for maximum reach
@@ -288,106 +453,216 @@ class AnalysisPrompts:
         5. Recommendations for improving engagement
         6. Audience behavior patterns
         7. Content optimization strategies
-        
+
         Respond in JSON format with actionable insights:
-        {{
-            "engagement_drivers": {{
+        {
+            "engagement_drivers": {
                 "high_impact_factors": [
-                    {{"factor": "text_length", "optimal_range": "100-150 characters", "impact_score": 0.8}},
-                    {{"factor": "hashtags", "optimal_count": "2-3", "impact_score": 0.7}},
-                    {{"factor": "media_presence", "impact": "increases_engagement_by_40%", "impact_score": 0.9}}
+                    {"factor": "text_length", "optimal_range": "100-150 characters", "impact_score": 0.8},
+                    {"factor": "hashtags", "optimal_count": "2-3", "impact_score": 0.7},
+                    {"factor": "media_presence", "impact": "increases_engagement_by_40%", "impact_score": 0.9}
                 ],
-                "content_types": {{
-                    "questions": {{"avg_engagement": 0.12, "best_practice": "end with question mark"}},
-                    "images": {{"avg_engagement": 0.15, "best_practice": "high quality, relevant"}},
-                    "videos": {{"avg_engagement": 0.20, "best_practice": "under 60 seconds"}}
-                }}
-            }},
-            "optimal_characteristics": {{
-                "text_length": {{"min": 80, "max": 150, "reasoning": "balance between information and readability"}},
-                "posting_time": {{"optimal_hours": ["9-11", "14-16", "19-21"], "timezone": "user_local"}},
-                "hashtag_strategy": {{"count": "2-3", "types": ["trending", "niche", "branded"]}},
+                "content_types": {
+                    "questions": {"avg_engagement": 0.12, "best_practice": "end with question mark"},
+                    "images": {"avg_engagement": 0.15, "best_practice": "high quality, relevant"},
+                    "videos": {"avg_engagement": 0.20, "best_practice": "under 60 seconds"}
+                }
+            },
+            "optimal_characteristics": {
+                "text_length": {"min": 80, "max": 150, "reasoning": "balance between information and readability"},
+                "posting_time": {"optimal_hours": ["9-11", "14-16", "19-21"], "timezone": "user_local"},
+                "hashtag_strategy": {"count": "2-3", "types": ["trending", "niche", "branded"]},
                 "media_recommendations": ["high_quality_images", "short_videos", "infographics"]
-            }},
-            "engagement_benchmarks": {{
-                "excellent": {{"like_rate": "> 5%", "retweet_rate": "> 1%", "reply_rate": "> 0.5%"}},
-                "good": {{"like_rate": "2-5%", "retweet_rate": "0.5-1%", "reply_rate": "0.2-0.5%"}},
-                "average": {{"like_rate": "1-2%", "retweet_rate": "0.2-0.5%", "reply_rate": "0.1-0.2%"}}
-            }},
+            },
+            "engagement_benchmarks": {
+                "excellent": {"like_rate": "> 5%", "retweet_rate": "> 1%", "reply_rate": "> 0.5%"},
+                "good": {"like_rate": "2-5%", "retweet_rate": "0.5-1%", "reply_rate": "0.2-0.5%"},
+                "average": {"like_rate": "1-2%", "retweet_rate": "0.2-0.5%", "reply_rate": "0.1-0.2%"}
+            },
             "correlations": [
-                {{"feature1": "follower_count", "feature2": "engagement_rate", "correlation": -0.3, "insight": "larger accounts often have lower engagement rates"}},
-                {{"feature1": "media_presence", "feature2": "retweets", "correlation": 0.6, "insight": "visual content drives sharing"}}
+                {"feature1": "follower_count", "feature2": "engagement_rate", "correlation": -0.3, "insight": "larger accounts often have lower engagement rates"},
+                {"feature1": "media_presence", "feature2": "retweets", "correlation": 0.6, "insight": "visual content drives sharing"}
             ],
-            "recommendations": {{
+            "recommendations": {
                 "immediate_actions": [
-                    {{"action": "optimize_posting_time", "expected_improvement": "15-25%", "difficulty": "easy"}},
-                    {{"action": "add_relevant_media", "expected_improvement": "30-50%", "difficulty": "medium"}}
+                    {"action": "optimize_posting_time", "expected_improvement": "15-25%", "difficulty": "easy"},
+                    {"action": "add_relevant_media", "expected_improvement": "30-50%", "difficulty": "medium"}
                 ],
                 "long_term_strategies": [
-                    {{"strategy": "build_community_engagement", "timeline": "3-6 months", "expected_roi": "high"}},
-                    {{"strategy": "develop_content_series", "timeline": "1-3 months", "expected_roi": "medium"}}
+                    {"strategy": "build_community_engagement", "timeline": "3-6 months", "expected_roi": "high"},
+                    {"strategy": "develop_content_series", "timeline": "1-3 months", "expected_roi": "medium"}
                 ]
-            }},
-            "audience_insights": {{
-                "peak_activity": {{"days": ["Tuesday", "Wednesday"], "hours": ["14:00-16:00"]}},
+            },
+            "audience_insights": {
+                "peak_activity": {"days": ["Tuesday", "Wednesday"], "hours": ["14:00-16:00"]},
                 "content_preferences": ["educational", "entertaining", "news"],
                 "engagement_style": "prefers_visual_content_with_clear_call_to_action"
-            }},
+            },
             "insights": "Strategic insights for maximizing engagement and reach"
-        }}
+        }
         """
-    
+
+
+# "1. " through "50. " rendered once at import; the numbered block no
+# longer formats an integer per line per prompt.
+_PREFIXES = tuple(f"{i}. " for i in range(1, 51))
+
+
+@lru_cache(maxsize=32)
+def _numbered_cached(texts: tuple) -> str:
+    assert len(texts) <= len(_PREFIXES), "grow _PREFIXES alongside the tweet limit"
+    return "\n".join(_PREFIXES[i] + text for i, text in enumerate(texts))
+
+
+# Thread expansions and long quotes can run to kilobytes; capping at X's
+# canonical 280 keeps prompt size (and thus LLM latency/cost) bounded.
+_MAX_TWEET_CHARS = 280
+
+
+def _truncate(text: str) -> str:
+    if len(text) <= _MAX_TWEET_CHARS:
+        return text
+    return text[:_MAX_TWEET_CHARS - 3] + '...'
+
+
+def _numbered_tweets(tweet_texts: List[str], limit: int = 50) -> str:
+    """Render the shared numbered tweet block.
+
+    The same batch usually feeds several analyses in one pipeline run
+    (sentiment + topic + summary + ...), so the formatted block is cached
+    on the tuple of texts rather than rebuilt per prompt.
+
+    Retweets and quote-tweets frequently produce identical bodies; each
+    unique text is numbered once with an [xN] multiplicity marker so
+    duplicate bodies stop wasting tokens while frequency-sensitive
+    analyses (sentiment ratios, trends) keep the counts. Texts over
+    280 characters are truncated with an ellipsis.
+    """
+    counts = Counter(tweet_texts)
+    unique = tuple(dict.fromkeys(tweet_texts))[:limit]
+    dropped = sum(len(text) - _MAX_TWEET_CHARS for text in unique
+                  if len(text) > _MAX_TWEET_CHARS)
+    if dropped:
+        logger.debug("Truncated %d chars of over-long tweet text for prompt", dropped)
+    return _numbered_cached(tuple(
+        f"[x{counts[text]}] {_truncate(text)}" if counts[text] > 1 else _truncate(text)
+        for text in unique
+    ))
+
+
+@lru_cache(maxsize=8)
+def _specialized(method: str, n: int) -> str:
+    """Template with the tweet count baked in and braces unescaped.
+
+    Batch sizes repeat constantly (the analyzer slices to fixed sizes), so
+    per-(method, n) scaffolding is rendered once; at call time only the
+    numbered block is substituted with a single str.replace instead of a
+    full format_map pass over the whole template.
+    """
+    tmpl = _TMPLS[method].replace('{n}', str(n))
+    return tmpl.replace('{{', '{').replace('}}', '}')
+
+
+class AnalysisPrompts:
+
     @staticmethod
-    def custom_analysis(tweet_texts: List[str], custom_prompt: str) -> str:
-        return f"""
-        {custom_prompt}
-        
-        Analyze the following {len(tweet_texts)} tweets according to the above requirements:
-        {chr(10).join([f"{i+1}. {text}" for i, text in enumerate(tweet_texts[:50])])}
-        
-        Respond in JSON format with structured results that address the specific analysis requested.
-        Ensure your response includes:
-        1. Clear categorization of findings
-        2. Quantitative metrics where applicable
-        3. Qualitative insights and interpretations
-        4. Actionable recommendations
-        5. Supporting evidence from the tweet data
-        
-        Structure your response as:
-        {{
-            "analysis_type": "custom_analysis",
-            "findings": {{
-                "key_metrics": {{}},
-                "patterns": [],
-                "insights": []
-            }},
-            "recommendations": [],
-            "supporting_evidence": [],
-            "conclusion": "Summary of key findings and implications"
-        }}
+    def sentiment_analysis(tweet_texts: List[str]) -> str:
+        return _specialized('sentiment', len(tweet_texts)).replace('{tweets}', _numbered_tweets(tweet_texts))
+
+    @staticmethod
+    def topic_analysis(tweet_texts: List[str]) -> str:
+        return _specialized('topics', len(tweet_texts)).replace('{tweets}', _numbered_tweets(tweet_texts))
+
+    @staticmethod
+    def summary_generation(tweet_texts: List[str]) -> str:
+        return _specialized('summary', len(tweet_texts)).replace('{tweets}', _numbered_tweets(tweet_texts))
+
+    @staticmethod
+    def classification_analysis(tweet_texts: List[str],
+                                categories: Optional[List[str]] = None) -> str:
+        if categories is None:
+            block = _CATEGORY_BLOCK
+        else:
+            wanted = set(categories)
+            block = "\n".join(f"        - {name}: {desc}"
+                              for name, desc in _CATEGORIES if name in wanted)
+        return (_specialized('classification', len(tweet_texts))
+                .replace('{categories}', block)
+                .replace('{tweets}', _numbered_tweets(tweet_texts)))
+
+    @staticmethod
+    def entity_extraction(tweet_texts: List[str]) -> str:
+        return _specialized('entities', len(tweet_texts)).replace('{tweets}', _numbered_tweets(tweet_texts))
+
+    @staticmethod
+    def combined_analysis(tweet_texts: List[str],
+                          sections: Optional[List[str]] = None) -> str:
+        """Build one prompt covering several analyses of the same batch.
+
+        The numbered tweet block is by far the largest part of each prompt;
+        embedding it once and requesting all sections in a single response
+        replaces up to five LLM calls with one.
+        """
+        if sections is None:
+            sections = list(_SECTION_INSTRUCTIONS)
+        unknown = [s for s in sections if s not in _SECTION_INSTRUCTIONS]
+        if unknown:
+            raise ValueError(f"Unknown analysis sections: {unknown}")
+        return _COMBINED_TMPL.format_map({
+            "n": len(tweet_texts),
+            "instructions": "\n".join(f"        {_SECTION_INSTRUCTIONS[s]}" for s in sections),
+            "tweets": _numbered_tweets(tweet_texts),
+            "schemas": ",\n".join(f"            {_SECTION_SCHEMAS[s]}" for s in sections),
+        })
+
+    @staticmethod
+    def trend_analysis(tweet_data: List[Dict[str, Any]]) -> str:
+        buf = io.StringIO()
+        buf.write(_TREND_PREFIX)
+        _dump_into([_slim_trend(t) for t in tweet_data], buf)
+        buf.write(_TREND_SUFFIX)
+        return buf.getvalue()
+
+    @staticmethod
+    def trend_analysis_columnar(cols: Dict[str, List[Any]]) -> str:
+        """Columnar variant of trend_analysis.
+
+        Accepts index-aligned columns (see _aos_to_soa) so the embedded
+        JSON repeats each field name once rather than once per tweet -
+        a 40-60% token cut on wide tables. Full text columns are replaced
+        by their lengths, matching the row-wise slimming.
         """
-    
+        slim_cols = {key: values for key, values in cols.items()
+                     if key in _TREND_FIELDS or key == 'text_length'}
+        if 'text_length' not in slim_cols and 'text' in cols:
+            slim_cols['text_length'] = [len(t) for t in cols['text']]
+        buf = io.StringIO()
+        buf.write(_TREND_COLUMNAR_PREFIX)
+        _dump_into(slim_cols, buf)
+        buf.write(_TREND_SUFFIX)
+        return buf.getvalue()
+
+    @staticmethod
+    def engagement_analysis(engagement_data: List[Dict[str, Any]]) -> str:
+        buf = io.StringIO()
+        buf.write(_ENGAGEMENT_PREFIX)
+        _dump_into(engagement_data, buf)
+        buf.write(_ENGAGEMENT_SUFFIX)
+        return buf.getvalue()
+
+    @staticmethod
+    def custom_analysis(tweet_texts: List[str], custom_prompt: str) -> str:
+        return _CUSTOM_TMPL.format_map({
+            "custom_prompt": custom_prompt,
+            "n": len(tweet_texts),
+            "tweets": _numbered_tweets(tweet_texts),
+        })
+
     @staticmethod
     def get_system_prompt() -> str:
-        return """You are an expert social media analyst specializing in Twitter/X data analysis. 
-        
-        Your expertise includes:
-        - Sentiment analysis and emotional intelligence
-        - Topic modeling and trend identification
-        - Social media engagement optimization
-        - Content classification and categorization
-        - Named entity recognition and relationship mapping
-        - Viral content pattern recognition
-        - Audience behavior analysis
-        
-        Guidelines for your analysis:
-        1. Always provide data-driven insights backed by evidence from the tweets
-        2. Use quantitative metrics whenever possible (percentages, scores, counts)
-        3. Identify actionable patterns that can inform strategy
-        4. Consider context, timing, and social dynamics in your analysis
-        5. Highlight both opportunities and risks in your findings
-        6. Provide clear, structured responses in valid JSON format
-        7. Include confidence scores for subjective assessments
-        8. Explain your reasoning for key insights
-        
-        Respond with detailed, accurate analysis that provides real value for social media strategy and understanding."""
\ No newline at end of file
+        return _SYSTEM_PROMPT
+
+    @staticmethod
+    def get_system_prompt_hash() -> str:
+        return _SYSTEM_PROMPT_HASH
+
@@ -1,123 +1,256 @@
 import asyncio
 import logging
+from collections import deque
 import random
+import re
+import threading
 import time
 from typing import Dict, List, Optional, Any
 import aiohttp
+import numpy as np
+
+try:
+    from aiohttp_socks import ProxyConnector
+except ImportError:
+    ProxyConnector = None
 import requests
 from fake_useragent import UserAgent
 
+# One process-wide session for the rotation endpoint so repeated rotations
+# reuse the same TCP/TLS connection instead of handshaking every time.
+_ROTATION_SESSION = requests.Session()
+
+# host:port with an optional scheme prefix and optional user:pass
+# credentials. The password group is greedy so embedded colons survive,
+# which a split(':')-based parse gets wrong.
+_PROXY_RE = re.compile(
+    r'^(?:(?P<scheme>\w+)://)?(?P<host>[^:]+):(?P<port>\d+)'
+    r'(?::(?P<user>[^:]+):(?P<pw>.+))?$'
+)
+# Provider convention: the port selects the protocol for credentialed
+# entries; anything unrecognized is treated as plain HTTP.
+_PORT_SCHEME = {'20000': 'http', '20002': 'socks5'}
+
+# Used when fake_useragent cannot produce a pool (no dataset, offline).
+_FALLBACK_UAS = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/117.0"
+)
+
 
 class ProxyManager:
-    
-    def __init__(self, proxies: List[Dict[str, str]] = [], rotation_url: str = ""):
+
+    # How long success/failure deltas may sit in the pending buffer before
+    # being folded into the stats arrays.
+    _FLUSH_INTERVAL = 0.25
+
+    # Sliding window over per-proxy request outcomes used for schedule
+    # weights (seconds).
+    _OUTCOME_WINDOW = 900.0
+
+    def __init__(self, proxies: Optional[List[Dict[str, str]]] = None, rotation_url: str = "",
+                 connect_timeout: float = 3.0, read_timeout: float = 5.0,
+                 total_timeout: float = 10.0):
         self.logger = logging.getLogger(__name__)
         self.proxies = proxies or []
         self.rotation_url = rotation_url
-        self.proxy_stats = {}
+        # Separate connect/read budgets: a single total lumps DNS, TCP, TLS
+        # and body read together, so long reads eat the connect budget and
+        # unreachable proxies take the full window to fail.
+        self._timeout = aiohttp.ClientTimeout(
+            total=total_timeout, connect=connect_timeout, sock_read=read_timeout)
         self.current_proxy_index = 0
-        self.failed_proxies = set()
+        # Incrementally maintained view of usable proxy indices; selection
+        # reads this instead of rescanning every proxy per request.
+        self._working_indices = set(range(len(self.proxies)))
         self.ua = UserAgent()
-        
+        # fake_useragent hits its parsed dataset on every attribute access;
+        # sample a pool of strings once and rotate through it instead.
+        try:
+            self._ua_pool = tuple(self.ua.chrome for _ in range(32))
+        except Exception:
+            self._ua_pool = _FALLBACK_UAS
+        # Shared session for all proxy validations; created lazily on the
+        # running loop and closed via close()/async-with. Per-request
+        # sessions spend most of the validation window on connector setup.
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Caps concurrent validation sockets; without it validate_all_proxies
+        # opens one connection per proxy at once. Created lazily on the
+        # running loop like the session.
+        self._val_sem: Optional[asyncio.Semaphore] = None
+
         if rotation_url:
             self.logger.info(f"Manual rotation API configured")
-        
-        for i in range(len(self.proxies)):
-            self.proxy_stats[i] = {
-                'success_count': 0,
-                'failure_count': 0,
-                'last_used': 0,
-                'response_time': 0,
-                'is_working': True
-            }
+
+        # Timing fields (last_used, response_time) are on time.monotonic:
+        # recency math must not jump under NTP steps, and monotonic avoids
+        # the wall-clock syscall on the per-request marking path.
+        # Per-proxy stats as parallel arrays (SoA): scoring over hundreds
+        # of proxies becomes a handful of vectorized expressions instead of
+        # a Python loop over dicts.
+        # Arrays are over-allocated and grown by doubling, so add_proxy is
+        # amortized O(1) instead of an O(N) reallocation per call.
+        # len(self.proxies) is the logical length; readers slice to it.
+        self._capacity = max(16, len(self.proxies))
+        self._success = np.zeros(self._capacity, np.int64)
+        self._failure = np.zeros(self._capacity, np.int64)
+        self._last_used = np.zeros(self._capacity, np.float64)
+        self._rt = np.zeros(self._capacity, np.float64)
+        self._working = np.ones(self._capacity, np.bool_)
+
+        # Recent request outcomes per proxy as (monotonic_ts, ok). Schedule
+        # weights derive from the last 15 minutes of these, so a burst of
+        # transient failures decays out of the window instead of sidelining
+        # a proxy until a global reset.
+        self._history: List[deque] = [deque(maxlen=255)
+                                      for _ in range(len(self.proxies))]
+
+        # Success/failure marks land in a small pending buffer under a lock
+        # and are folded into the arrays in batches, so concurrent scrape
+        # tasks (or real threads) don't race on array element updates.
+        # Index -> [success_delta, failure_delta, last_used, response_time].
+        self._pending: Dict[int, List[float]] = {}
+        self._pending_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+        # Weighted round-robin schedule: working proxies expanded into a
+        # shuffled slot list sized by score, walked one entry per request.
+        self._schedule: List[int] = []
+        self._sched_idx = 0
+        self._sched_pass = 0
+        self._sched_dirty = True
     
     def add_proxy(self, proxy: Dict[str, str]) -> None:
         self.proxies.append(proxy)
         index = len(self.proxies) - 1
-        self.proxy_stats[index] = {
-            'success_count': 0,
-            'failure_count': 0,
-            'last_used': 0,
-            'response_time': 0,
-            'is_working': True
-        }
+        if index >= self._capacity:
+            self._grow(2 * self._capacity)
+        self._success[index] = 0
+        self._failure[index] = 0
+        self._last_used[index] = 0.0
+        self._rt[index] = 0.0
+        self._working[index] = True
+        self._history.append(deque(maxlen=255))
+        self._working_indices.add(index)
+        self._sched_dirty = True
         self.logger.info(f"Added proxy: {proxy.get('http', 'Unknown')}")
+
+    def _grow(self, new_capacity: int) -> None:
+        for name in ('_success', '_failure', '_last_used', '_rt', '_working'):
+            old = getattr(self, name)
+            grown = np.zeros(new_capacity, old.dtype)
+            grown[:old.shape[0]] = old
+            setattr(self, name, grown)
+        self._capacity = new_capacity
     
     def get_next_proxy(self) -> Optional[Dict[str, str]]:
         if not self.proxies:
             return None
         
-        working_proxies = [
-            i for i in range(len(self.proxies)) 
-            if i not in self.failed_proxies and self.proxy_stats[i]['is_working']
-        ]
-        
-        if not working_proxies:
+        if not self._working_indices:
             self.logger.warning("All proxies failed, resetting failure list")
-            self.failed_proxies.clear()
-            for i in self.proxy_stats:
-                self.proxy_stats[i]['is_working'] = True
-            working_proxies = list(range(len(self.proxies)))
-        
-        best_proxy_index = self._select_best_proxy(working_proxies)
+            self._working[:len(self.proxies)] = True
+            self._working_indices = set(range(len(self.proxies)))
+            self._sched_dirty = True
+
+        if self._sched_dirty or not self._schedule:
+            self._rebuild_schedule()
+
+        best_proxy_index = self._schedule[self._sched_idx]
+        self._sched_idx += 1
+        if self._sched_idx >= len(self._schedule):
+            self._sched_idx = 0
+            self._sched_pass += 1
+            # Periodic rebuild picks up drifting scores even when no proxy
+            # flips state.
+            if self._sched_pass >= 5:
+                self._sched_pass = 0
+                self._sched_dirty = True
         self.current_proxy_index = best_proxy_index
-        
+
         return self.proxies[best_proxy_index]
     
-    def _select_best_proxy(self, working_proxies: List[int]) -> int:
-        if len(working_proxies) == 1:
-            return working_proxies[0]
-        
-        proxy_scores = []
-        current_time = time.time()
-        
-        for proxy_index in working_proxies:
-            stats = self.proxy_stats[proxy_index]
-            
-            total_requests = stats['success_count'] + stats['failure_count']
-            success_rate = stats['success_count'] / max(total_requests, 1)
-            
-            time_since_last_use = current_time - stats['last_used']
-            recency_bonus = min(time_since_last_use / 300, 1.0) 
-            
-            response_time_penalty = min(stats['response_time'] / 10, 1.0)  
-            
-            score = (success_rate * 0.5) + (recency_bonus * 0.3) - (response_time_penalty * 0.2)
-            proxy_scores.append((proxy_index, score))
-        
-        proxy_scores.sort(key=lambda x: x[1], reverse=True)
-        
-        top_performers = proxy_scores[:min(3, len(proxy_scores))]
-        weights = [score for _, score in top_performers]
-        
-        if sum(weights) > 0:
-            selected = random.choices(top_performers, weights=weights)[0]
-            return selected[0]
-        else:
-            return random.choice(working_proxies)
-    
+    def _outcome_weight(self, index: int, now: float) -> int:
+        successes = failures = 0
+        for timestamp, ok in self._history[index]:
+            if now - timestamp >= self._OUTCOME_WINDOW:
+                continue
+            if ok:
+                successes += 1
+            else:
+                failures += 1
+        return max(0, min(200 + 5 * successes - 10 * failures, 400))
+
+    def _rebuild_schedule(self) -> None:
+        now = time.monotonic()
+        schedule: List[int] = []
+        for index in self._working_indices:
+            weight = self._outcome_weight(index, now)
+            if weight:
+                # 100 weight points per slot keeps the schedule short while
+                # preserving the 0-400 range as 1-4 slots.
+                schedule.extend([index] * max(weight // 100, 1))
+        if not schedule:
+            schedule = list(self._working_indices) or list(range(len(self.proxies)))
+        random.shuffle(schedule)
+        self._schedule = schedule
+        self._sched_idx = 0
+        self._sched_dirty = False
+
     def mark_proxy_success(self, proxy_index: int, response_time: float) -> None:
-        if proxy_index in self.proxy_stats:
-            stats = self.proxy_stats[proxy_index]
-            stats['success_count'] += 1
-            stats['last_used'] = time.time()
-            stats['response_time'] = response_time
-            stats['is_working'] = True
-            
-            self.failed_proxies.discard(proxy_index)
-    
+        if 0 <= proxy_index < len(self.proxies):
+            with self._pending_lock:
+                slot = self._pending.setdefault(proxy_index, [0, 0, 0.0, 0.0])
+                slot[0] += 1
+                slot[2] = time.monotonic()
+                slot[3] = response_time
+            self._history[proxy_index].append((time.monotonic(), True))
+            # Working-state flips affect routing directly, so they bypass
+            # the pending buffer.
+            self._working[proxy_index] = True
+            self._working_indices.add(proxy_index)
+            self._maybe_flush()
+
     def mark_proxy_failure(self, proxy_index: int) -> None:
-        if proxy_index in self.proxy_stats:
-            stats = self.proxy_stats[proxy_index]
-            stats['failure_count'] += 1
-            
-            total_requests = stats['success_count'] + stats['failure_count']
-            failure_rate = stats['failure_count'] / max(total_requests, 1)
-            
-            if failure_rate > 0.7 or stats['failure_count'] >= 5:
-                stats['is_working'] = False
-                self.failed_proxies.add(proxy_index)
+        if 0 <= proxy_index < len(self.proxies):
+            with self._pending_lock:
+                slot = self._pending.setdefault(proxy_index, [0, 0, 0.0, 0.0])
+                slot[1] += 1
+                pending_successes, pending_failures = slot[0], slot[1]
+            self._history[proxy_index].append((time.monotonic(), False))
+
+            failures = int(self._failure[proxy_index]) + pending_failures
+            total_requests = int(self._success[proxy_index]) + pending_successes + failures
+            failure_rate = failures / max(total_requests, 1)
+
+            if failure_rate > 0.7 or failures >= 5:
+                self._working[proxy_index] = False
+                self._working_indices.discard(proxy_index)
+                self._sched_dirty = True
                 self.logger.warning(f"Proxy {proxy_index} marked as not working (failure rate: {failure_rate:.2f})")
+            self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if time.monotonic() - self._last_flush >= self._FLUSH_INTERVAL:
+            self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        with self._pending_lock:
+            if not self._pending:
+                self._last_flush = time.monotonic()
+                return
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+        for index, (successes, failures, last_used, response_time) in pending.items():
+            self._success[index] += int(successes)
+            self._failure[index] += int(failures)
+            if last_used:
+                self._last_used[index] = last_used
+            if response_time:
+                self._rt[index] = response_time
     
     async def validate_proxy(self, proxy: Dict[str, str]) -> bool:
         test_urls = [
@@ -126,25 +259,90 @@ class ProxyManager:
             'http://ip-api.com/json'
         ]
         
-        for url in test_urls:
-            try:
-                start_time = time.time()
-                
-                async with aiohttp.ClientSession(
-                    connector=aiohttp.TCPConnector(ssl=False),
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as session:
-                    async with session.get(url, proxy=proxy.get('http')) as response:
-                        if response.status == 200:
-                            response_time = time.time() - start_time
-                            self.logger.info(f"Proxy validation successful: {proxy.get('http')} ({response_time:.2f}s)")
-                            return True
-                            
-            except Exception as e:
-                self.logger.debug(f"Proxy validation failed for {url}: {str(e)}")
-                continue
-        
+        if proxy.get('type') == 'socks5':
+            return await self._validate_socks_proxy(proxy, test_urls)
+
+        session = await self._get_session()
+        start_time = time.monotonic()
+
+        async def _probe(url: str) -> bool:
+            async with session.get(url, proxy=proxy.get('http')) as response:
+                return response.status == 200
+
+        # Race the endpoints instead of trying them one after another:
+        # validation latency becomes the fastest responder, and a stalled
+        # endpoint no longer blocks an otherwise-good proxy.
+        tasks = [asyncio.create_task(_probe(url)) for url in test_urls]
+        try:
+            for fut in asyncio.as_completed(tasks):
+                try:
+                    if await fut:
+                        response_time = time.monotonic() - start_time
+                        self.logger.info(f"Proxy validation successful: {proxy.get('http')} ({response_time:.2f}s)")
+                        return True
+                except Exception as e:
+                    self.logger.debug(f"Proxy validation failed: {str(e)}")
+            return False
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _validate_socks_proxy(self, proxy: Dict[str, str],
+                                    test_urls: List[str]) -> bool:
+        # aiohttp has no native SOCKS5 support, so these requests would
+        # silently fail through the shared session; they go through a
+        # short-lived session with a per-proxy ProxyConnector instead.
+        if ProxyConnector is None:
+            self.logger.warning("aiohttp-socks not installed; cannot validate SOCKS5 proxies")
+            return False
+
+        start_time = time.monotonic()
+        try:
+            connector = ProxyConnector.from_url(proxy['http'])
+            async with aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=self._timeout) as session:
+                for url in test_urls:
+                    try:
+                        async with session.get(url) as response:
+                            if response.status == 200:
+                                response_time = time.monotonic() - start_time
+                                self.logger.info(f"Proxy validation successful: {proxy.get('http')} ({response_time:.2f}s)")
+                                return True
+                    except Exception as e:
+                        self.logger.debug(f"Proxy validation failed for {url}: {str(e)}")
+        except Exception as e:
+            self.logger.debug(f"SOCKS5 proxy validation failed: {str(e)}")
         return False
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            # Keep tunnelled proxy sockets warm between requests: repeat
+            # requests through the same proxy skip the TCP/TLS/CONNECT
+            # handshake. limit=0 leaves the overall cap to the validation
+            # semaphore; limit_per_host stops one endpoint hogging sockets.
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    ssl=False,
+                    limit=0,
+                    limit_per_host=8,
+                    keepalive_timeout=120,
+                    force_close=False,
+                ),
+                timeout=self._timeout
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> 'ProxyManager':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
     
     async def validate_all_proxies(self) -> None:
         if not self.proxies:
@@ -157,45 +355,65 @@ class ProxyManager:
             task = self._validate_single_proxy(i, proxy)
             validation_tasks.append(task)
         
-        await asyncio.gather(*validation_tasks, return_exceptions=True)
-        
-        working_count = sum(1 for stats in self.proxy_stats.values() if stats['is_working'])
+        results = await asyncio.gather(*validation_tasks, return_exceptions=True)
+
+        # Apply all outcomes at once: one fancy-indexed store and a single
+        # version/dirty bump for the sweep, rather than N interleaved
+        # mutations each invalidating the cached selection state.
+        pairs = [r for r in results if not isinstance(r, BaseException)]
+        if pairs:
+            indices, outcomes = zip(*pairs)
+            self._working[list(indices)] = list(outcomes)
+            for index, ok in pairs:
+                if ok:
+                    self._working_indices.add(index)
+                else:
+                    self._working_indices.discard(index)
+            self._sched_dirty = True
+
+        working_count = int(self._working[:len(self.proxies)].sum())
         self.logger.info(f"Proxy validation complete: {working_count}/{len(self.proxies)} working")
     
-    async def _validate_single_proxy(self, index: int, proxy: Dict[str, str]) -> None:
+    async def _validate_single_proxy(self, index: int,
+                                     proxy: Dict[str, str]) -> tuple:
+        if self._val_sem is None:
+            self._val_sem = asyncio.Semaphore(64)
         try:
-            is_working = await self.validate_proxy(proxy)
-            self.proxy_stats[index]['is_working'] = is_working
-            
-            if not is_working:
-                self.failed_proxies.add(index)
-                
+            async with self._val_sem:
+                return index, await self.validate_proxy(proxy)
         except Exception as e:
             self.logger.error(f"Error validating proxy {index}: {str(e)}")
-            self.proxy_stats[index]['is_working'] = False
-            self.failed_proxies.add(index)
+            return index, False
     
     def get_random_user_agent(self) -> str:
-        try:
-            return self.ua.chrome
-        except Exception:
-            fallback_agents = [
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
-                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/117.0"
-            ]
-            return random.choice(fallback_agents)
+        return random.choice(self._ua_pool or _FALLBACK_UAS)
     
-    def trigger_manual_rotation(self) -> bool:
+    async def trigger_manual_rotation(self) -> bool:
         if not self.rotation_url:
             self.logger.debug("No rotation URL configured")
             return False
-        
+
         try:
             self.logger.info("Triggering manual proxy rotation...")
-            response = requests.get(self.rotation_url, timeout=10)
+            session = await self._get_session()
+            async with session.get(self.rotation_url) as response:
+                response.raise_for_status()
+            self.logger.info("Proxy IP rotated successfully")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to rotate proxy: {str(e)}")
+            return False
+
+    def trigger_manual_rotation_sync(self) -> bool:
+        """Blocking shim for legacy callers running outside an event loop."""
+        if not self.rotation_url:
+            self.logger.debug("No rotation URL configured")
+            return False
+
+        try:
+            self.logger.info("Triggering manual proxy rotation...")
+            response = _ROTATION_SESSION.get(self.rotation_url,
+                                             timeout=self._timeout.total)
             response.raise_for_status()
             self.logger.info("Proxy IP rotated successfully")
             return True
@@ -203,94 +421,77 @@ class ProxyManager:
             self.logger.error(f"Failed to rotate proxy: {str(e)}")
             return False
     
-    def get_proxy_stats(self) -> Dict[str, Any]:
+    def get_proxy_stats(self, detailed: bool = False) -> Dict[str, Any]:
         if not self.proxies:
             return {"total_proxies": 0, "working_proxies": 0, "failed_proxies": 0}
-        
-        working_proxies = sum(1 for stats in self.proxy_stats.values() if stats['is_working'])
-        failed_proxies = len(self.failed_proxies)
-        
-        total_requests = sum(
-            stats['success_count'] + stats['failure_count'] 
-            for stats in self.proxy_stats.values()
-        )
-        
-        total_successes = sum(stats['success_count'] for stats in self.proxy_stats.values())
-        
+
+        self._flush_pending()
+        n = len(self.proxies)
+        working_proxies = int(self._working[:n].sum())
+        failed_proxies = n - working_proxies
+
+        total_successes = int(self._success[:n].sum())
+        total_requests = total_successes + int(self._failure[:n].sum())
+
         success_rate = (total_successes / max(total_requests, 1)) * 100
-        
-        return {
+
+        stats = {
             "total_proxies": len(self.proxies),
             "working_proxies": working_proxies,
             "failed_proxies": failed_proxies,
             "total_requests": total_requests,
             "success_rate": round(success_rate, 2),
             "current_proxy_index": self.current_proxy_index,
-            "proxy_details": [
+        }
+        # The per-proxy list dominates the cost of this call on large pools
+        # and most callers only want the aggregates, so it's opt-in.
+        if detailed:
+            stats["proxy_details"] = [
                 {
                     "index": i,
                     "proxy": proxy.get('http', 'Unknown'),
-                    "is_working": self.proxy_stats[i]['is_working'],
-                    "success_count": self.proxy_stats[i]['success_count'],
-                    "failure_count": self.proxy_stats[i]['failure_count'],
-                    "response_time": self.proxy_stats[i]['response_time']
+                    "is_working": bool(self._working[i]),
+                    "success_count": int(self._success[i]),
+                    "failure_count": int(self._failure[i]),
+                    "response_time": float(self._rt[i])
                 }
                 for i, proxy in enumerate(self.proxies)
             ]
-        }
+        return stats
     
     @staticmethod
     def load_proxies_from_list(proxy_list: List[str]) -> List[Dict[str, str]]:
-        
+
         proxies = []
-        
+
         for proxy_str in proxy_list:
-            try:
-                if '://' in proxy_str:
-                   
-                    proxies.append({
-                        'http': proxy_str,
-                        'https': proxy_str
-                    })
-                elif proxy_str.count(':') == 1:
-                   
-                    ip, port = proxy_str.split(':')
-                    proxy_url = f"http://{ip}:{port}"
-                    proxies.append({
-                        'http': proxy_url,
-                        'https': proxy_url
-                    })
-                elif proxy_str.count(':') == 3:
-                    
-                    ip, port, user, password = proxy_str.split(':')
-
-                    if port == '20000':
-                        proxy_url = f"http://{user}:{password}@{ip}:{port}"
-                        proxies.append({
-                            'http': proxy_url,
-                            'https': proxy_url,
-                            'type': 'http'
-                        })
-                    elif port == '20002':
-                        
-                        proxy_url = f"socks5://{user}:{password}@{ip}:{port}"
-                        proxies.append({
-                            'http': proxy_url,
-                            'https': proxy_url,
-                            'type': 'socks5'
-                        })
-                    else:
-                        
-                        proxy_url = f"http://{user}:{password}@{ip}:{port}"
-                        proxies.append({
-                            'http': proxy_url,
-                            'https': proxy_url,
-                            'type': 'http'
-                        })
-                else:
-                    logging.warning(f"Unsupported proxy format: {proxy_str}")
-                    
-            except Exception as e:
-                logging.error(f"Error parsing proxy {proxy_str}: {str(e)}")
-                
+            if '://' in proxy_str:
+                # Already a full URL; pass it through untouched.
+                proxies.append({
+                    'http': proxy_str,
+                    'https': proxy_str
+                })
+                continue
+
+            match = _PROXY_RE.match(proxy_str)
+            if match is None:
+                logging.warning(f"Unsupported proxy format: {proxy_str}")
+                continue
+
+            host, port = match['host'], match['port']
+            if match['user'] is None:
+                proxy_url = f"http://{host}:{port}"
+                proxies.append({
+                    'http': proxy_url,
+                    'https': proxy_url
+                })
+            else:
+                scheme = _PORT_SCHEME.get(port, 'http')
+                proxy_url = f"{scheme}://{match['user']}:{match['pw']}@{host}:{port}"
+                proxies.append({
+                    'http': proxy_url,
+                    'https': proxy_url,
+                    'type': scheme
+                })
+
         return proxies
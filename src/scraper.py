@@ -1,20 +1,173 @@
 import asyncio
+import atexit
+import concurrent.futures
 import logging
 import logging.handlers
 import json
 import time
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-import aiofiles
-import pandas as pd
+from typing import Dict, List, Any, Optional, TYPE_CHECKING
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Part of the optional 'speed' extra: swaps in a faster event loop for
+# every await in the scraper. No-op when not installed.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from .config_manager import ConfigManager
 from .twitter_session import TwitterSession
 from .playwright_scraper import PlaywrightScraper
-from .ai_analyzer import AIAnalyzer, AnalysisType
 from .progress_manager import ProgressManager
 from .checkpoint_manager import CheckpointManager
 
+# pandas and the openai stack (via .ai_analyzer) together add ~500ms of
+# import time; both are deferred to first use so config checks and
+# --help start fast.
+if TYPE_CHECKING:
+    from .ai_analyzer import AIAnalyzer
+
+
+class _FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that skips the per-record stat().
+
+    shouldRollover sizes the log file with filesystem calls on every emit,
+    which is measurable when logging per tweet. Tracking the written byte
+    count locally keeps the common path syscall-free; the real filesystem
+    check only runs once the cached size nears maxBytes.
+
+    Writes are also buffered: INFO and below stay in a 64 KiB stream
+    buffer and only reach the disk on WARNING+, every 30 seconds, or at
+    shutdown (an atexit hook flushes the tail). The stock handler flushes
+    after every record, which dominates the logging path under load.
+    """
+
+    _FLUSH_INTERVAL = 30.0
+
+    def __init__(self, *args, **kwargs):
+        self._defer_flush = False
+        self._last_flush = time.monotonic()
+        super().__init__(*args, **kwargs)
+        self._cached_size = self.stream.tell() if self.stream else 0
+        atexit.register(self.flush)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=64 * 1024,
+                    encoding=self.encoding, errors=self.errors)
+
+    def shouldRollover(self, record):
+        if self.maxBytes <= 0:
+            return 0
+        record._msg_len = msg_len = len(self.format(record)) + 1
+        if self._cached_size + msg_len < self.maxBytes:
+            return 0
+        return super().shouldRollover(record)
+
+    def emit(self, record):
+        self._defer_flush = (
+            record.levelno < logging.WARNING
+            and time.monotonic() - self._last_flush < self._FLUSH_INTERVAL)
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+        self._cached_size += getattr(record, '_msg_len', 0)
+
+    def flush(self):
+        # StreamHandler.emit calls flush() after every record; honor it
+        # only when the record or the timer says so.
+        if self._defer_flush:
+            return
+        self._last_flush = time.monotonic()
+        super().flush()
+
+    def doRollover(self):
+        super().doRollover()
+        self._cached_size = 0
+
+
+_CSV_RENAMES = {
+    'user_username': 'username',
+    'user_display_name': 'display_name',
+    'user_followers_count': 'followers_count',
+    'user_verified': 'verified',
+    'metrics_retweet_count': 'retweet_count',
+    'metrics_favorite_count': 'favorite_count',
+    'metrics_reply_count': 'reply_count',
+    'metrics_view_count': 'view_count',
+}
+_CSV_COLUMNS = ['id', 'text', 'created_at', 'username', 'display_name',
+                'followers_count', 'verified', 'retweet_count',
+                'favorite_count', 'reply_count', 'view_count', 'is_retweet',
+                'is_reply', 'lang', 'hashtags', 'scraped_at']
+
+
+# CSV serialization is CPU-bound pandas work; running it in a separate
+# process keeps it off the event loop's threadpool (and out from under the
+# GIL) so the JSON writes genuinely overlap with it. Created lazily since
+# most runs use the default json output format.
+_CSV_POOL: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+
+def _get_csv_pool() -> concurrent.futures.ProcessPoolExecutor:
+    global _CSV_POOL
+    if _CSV_POOL is None:
+        _CSV_POOL = concurrent.futures.ProcessPoolExecutor(max_workers=1)
+    return _CSV_POOL
+
+
+def _serialize_csv(tweets_list: List[Dict[str, Any]], path: str) -> None:
+    # Runs in the CSV worker process, which is also the only place pandas
+    # is needed — importing it here keeps it out of parent startup.
+    import pandas as pd
+
+    # json_normalize flattens nested user/metrics dicts in pandas' C path
+    # instead of a per-tweet Python loop of .get() chains.
+    df = pd.json_normalize(tweets_list, sep='_', max_level=2)
+    df = df.rename(columns=_CSV_RENAMES)
+    if 'hashtags' in df.columns:
+        df['hashtags'] = df['hashtags'].map(
+            lambda tags: ', '.join(tags) if isinstance(tags, list) else '')
+    df = df.reindex(columns=_CSV_COLUMNS, fill_value='')
+    df.to_csv(path, index=False, encoding='utf-8')
+
+
+def _encode_json(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=str).encode('utf-8')
+
+
+def _sync_write_bytes(path: Path, data: bytes) -> None:
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _sync_dump_json(path: Path, obj: Any) -> None:
+    # Whole-file writes go through one asyncio.to_thread dispatch; aiofiles
+    # would bounce open/write/close through the threadpool separately.
+    # Serializing here too keeps multi-thousand-tweet dumps off the event
+    # loop thread; orjson emits bytes directly, so the file is opened binary.
+    _sync_write_bytes(path, _encode_json(obj))
+
+
+@dataclass(slots=True)
+class SessionStats:
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+    tweets_scraped: int = 0
+    analyses_performed: int = 0
+    errors_encountered: int = 0
+
 
 class XScraper:
     
@@ -24,19 +177,32 @@ class XScraper:
         
         self.twitter_session: Optional[TwitterSession] = None
         self.playwright_scraper: Optional[PlaywrightScraper] = None
-        self.ai_analyzer: Optional[AIAnalyzer] = None
+        self.ai_analyzer: Optional["AIAnalyzer"] = None
         self.progress_manager: Optional[ProgressManager] = None
         self.checkpoint_manager: CheckpointManager = CheckpointManager()
         
         self.is_running = False
         self.scraped_tweets = []
-        self.session_stats = {
-            'start_time': None,
-            'end_time': None,
-            'tweets_scraped': 0,
-            'analyses_performed': 0,
-            'errors_encountered': 0
-        }
+        # Serializes browser creation/login so concurrent calls in a batch
+        # workflow share one Playwright session instead of racing to build
+        # their own. Created lazily on the running loop.
+        self._login_lock: Optional[asyncio.Lock] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
+        # Single background writer; all byte payloads funnel through one
+        # queue so concurrent saves don't fan out across the threadpool.
+        self._write_q: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        # Parsed language allow-list, memoized on the raw setting string so
+        # the split/strip pass runs once, not on every filter call.
+        self._allowed_langs_raw: Optional[str] = None
+        self._allowed_langs: tuple = ()
+        self.session_stats = SessionStats()
+        # Output directories already created this run; saves skip the
+        # mkdir syscall after the first hit.
+        self._created_dirs: set = set()
+        # (key, bytes) memo of the last encoded tweets payload, so saving
+        # the same result set twice doesn't re-serialize it.
+        self._json_memo: tuple = (None, b'')
         
         self._initialize_components()
     
@@ -57,7 +223,7 @@ class XScraper:
             log_file = Path(logging_settings['log_file'])
             log_file.parent.mkdir(parents=True, exist_ok=True)
             
-            file_handler = logging.handlers.RotatingFileHandler(
+            file_handler = _FastRotatingFileHandler(
                 log_file,
                 maxBytes=logging_settings['max_log_size'],
                 backupCount=logging_settings['backup_count']
@@ -97,11 +263,13 @@ class XScraper:
             
             ai_settings = self.config_manager.get_ai_settings()
             if ai_settings.get('openai_api_key'):
+                from .ai_analyzer import AIAnalyzer
                 self.ai_analyzer = AIAnalyzer(
                     api_key=ai_settings['openai_api_key'],
                     model=ai_settings['model'],
                     max_tokens=ai_settings['max_tokens'],
-                    temperature=ai_settings['temperature']
+                    temperature=ai_settings['temperature'],
+                    max_concurrent_batches=ai_settings.get('max_concurrent_batches', 5)
                 )
                 self.logger.info("Initialized AI analyzer with OpenAI")
             else:
@@ -113,66 +281,121 @@ class XScraper:
             
             
             self.proxy_settings = proxy_settings
-            
+
+            # The getters rebuild their dicts with type conversions on each
+            # call; snapshot them once and read attributes thereafter.
+            # reload_config() refreshes the snapshots if the INI changes.
+            self._scraping_settings = self.config_manager.get_scraping_settings()
+            self._filter_settings = self.config_manager.get_filter_settings()
+            self._timeout_settings = self.config_manager.get_timeout_settings()
+
         except Exception as e:
             self.logger.error(f"Failed to initialize components: {str(e)}")
             raise
     
+    def reload_config(self) -> None:
+        """Refresh the cached settings snapshots after a config change."""
+        self._scraping_settings = self.config_manager.get_scraping_settings()
+        self._filter_settings = self.config_manager.get_filter_settings()
+        self._timeout_settings = self.config_manager.get_timeout_settings()
+        self._allowed_langs_raw = None
+
     async def login(self) -> bool:
-        
+
         try:
             if not self.twitter_session:
                 self.logger.error("Twitter session not initialized")
                 return False
-            
-            if self.playwright_scraper is None:
-                
-                creds = self.twitter_session.get_credentials()
-                
-                
-                self.playwright_scraper = PlaywrightScraper(
-                    username=creds['username'],
-                    password=creds['password'],
-                    email=creds['email'],
-                    scraping_config=self.config_manager.get_scraping_settings(),
-                    timeout_config=self.config_manager.get_timeout_settings(),
-                    proxy_config=self.proxy_settings if self.proxy_settings.get('enable_proxy_rotation') else None,
-                    progress_manager=self.progress_manager
-                )
-                
-                
-                if not await self.playwright_scraper.initialize():
-                    self.logger.error("Failed to initialize Playwright browser")
-                    return False
-                
-                
-                if await self.playwright_scraper.login():
-                    self.twitter_session.mark_logged_in()
-                    self.logger.info("Successfully logged in with Playwright")
-                    return True
-                else:
-                    self.logger.error("Login failed")
-                    return False
-            else:
-                
-                if self.twitter_session.is_logged_in:
-                    return True
-                else:
-                    return await self.playwright_scraper.login()
-            
+
+            if self._login_lock is None:
+                self._login_lock = asyncio.Lock()
+            async with self._login_lock:
+                return await self._login_locked()
+
         except Exception as e:
             self.logger.error(f"Login failed: {str(e)}")
             return False
-    
-    async def search_tweets(self, query: str, count: Optional[int] = None, 
+
+    async def _login_locked(self) -> bool:
+        if self.playwright_scraper is None:
+
+            creds = self.twitter_session.get_credentials()
+
+            self.playwright_scraper = PlaywrightScraper(
+                username=creds['username'],
+                password=creds['password'],
+                email=creds['email'],
+                scraping_config=self._scraping_settings,
+                timeout_config=self._timeout_settings,
+                proxy_config=self.proxy_settings if self.proxy_settings.get('enable_proxy_rotation') else None,
+                progress_manager=self.progress_manager
+            )
+
+            if not await self.playwright_scraper.initialize():
+                self.logger.error("Failed to initialize Playwright browser")
+                return False
+
+            if await self.playwright_scraper.login():
+                self.twitter_session.mark_logged_in()
+                self._start_keepalive()
+                self.logger.info("Successfully logged in with Playwright")
+                return True
+            else:
+                self.logger.error("Login failed")
+                return False
+        else:
+
+            if self.twitter_session.is_logged_in:
+                return True
+            else:
+                return await self.playwright_scraper.login()
+
+    def _start_keepalive(self) -> None:
+        if self._keepalive_task is None or self._keepalive_task.done():
+            self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+
+    async def _keepalive_loop(self) -> None:
+        # A light ping every 5 minutes keeps the browser session warm
+        # between batch calls, so the next scrape reuses the logged-in
+        # Playwright instance instead of paying a fresh login.
+        while True:
+            await asyncio.sleep(300)
+            if self.is_running or not self.playwright_scraper:
+                continue
+            try:
+                page = self.playwright_scraper.page
+                if page is not None:
+                    await page.evaluate("1")
+            except Exception as e:
+                self.logger.debug(f"Keepalive ping failed: {e}")
+
+    def _ensure_writer(self) -> None:
+        # Created lazily: __init__ runs before any event loop exists.
+        if self._writer_task is None or self._writer_task.done():
+            self._write_q = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._writer_loop())
+
+    async def _writer_loop(self) -> None:
+        # One coroutine owns all disk writes, so a save call only pays for
+        # serialization and enqueue; writes are serialized instead of
+        # competing for the threadpool and the same disk.
+        while True:
+            path, data = await self._write_q.get()
+            try:
+                await asyncio.to_thread(_sync_write_bytes, path, data)
+            except Exception as e:
+                self.logger.error(f"Failed to write {path}: {e}")
+            finally:
+                self._write_q.task_done()
+
+    async def search_tweets(self, query: str, count: Optional[int] = None,
                           result_type: Optional[str] = None, analyze: bool = True,
                           analysis_types: Optional[List[str]] = None) -> Dict[str, Any]:
         
-        scraping_settings = self.config_manager.get_scraping_settings()
-        max_tweets = count or scraping_settings.get('default_tweet_count', 50)
+        max_tweets = count or self._scraping_settings.get('default_tweet_count', 50)
         result_type = result_type or "Latest"
         
-        self.session_stats['start_time'] = time.time()
+        self.session_stats.start_time = time.time()
         self.is_running = True
         
         try:
@@ -183,7 +406,7 @@ class XScraper:
             if not self.playwright_scraper:
                 raise RuntimeError("Playwright scraper not initialized")
             
-            self.logger.info(f"Searching for: '{query}' (type: {result_type}, limit: {max_tweets})")
+            self.logger.info("Searching for: '%s' (type: %s, limit: %d)", query, result_type, max_tweets)
             
             search_result = await self.playwright_scraper.search_tweets(
                 query=query,
@@ -197,7 +420,7 @@ class XScraper:
             
             tweets = search_result.get('tweets', [])
             self.scraped_tweets.extend(tweets)
-            self.session_stats['tweets_scraped'] += len(tweets)
+            self.session_stats.tweets_scraped += len(tweets)
             
             result = {
                 'query': query,
@@ -218,18 +441,18 @@ class XScraper:
                     analysis_types or ['sentiment', 'topics', 'summary']
                 )
                 result['analysis'] = analysis_result
-                self.session_stats['analyses_performed'] += 1
+                self.session_stats.analyses_performed += 1
             
-            self.logger.info(f"Search completed: {len(filtered_tweets)} tweets found for '{query}'")
+            self.logger.info("Search completed: %d tweets found for '%s'", len(filtered_tweets), query)
             return result
             
         except Exception as e:
             self.logger.error(f"Search failed: {str(e)}")
-            self.session_stats['errors_encountered'] += 1
+            self.session_stats.errors_encountered += 1
             raise
         finally:
             self.is_running = False
-            self.session_stats['end_time'] = time.time()
+            self.session_stats.end_time = time.time()
     
     async def scrape_user_tweets(self, username: str, count: Optional[int] = None,
                                 analyze: bool = True, analysis_types: Optional[List[str]] = None,
@@ -237,10 +460,8 @@ class XScraper:
                                 resume: bool = False, max_tweets_per_session: Optional[int] = None) -> Dict[str, Any]:
 
         
-        scraping_settings = self.config_manager.get_scraping_settings()
-        
         if max_tweets_per_session is None:
-            config_limit = scraping_settings.get('max_tweets_per_session', 0)
+            config_limit = self._scraping_settings.get('max_tweets_per_session', 0)
             max_tweets_per_session = config_limit if config_limit > 0 else None
         
         checkpoint = None
@@ -252,18 +473,24 @@ class XScraper:
             if checkpoint:
                 existing_tweets = self.checkpoint_manager.load_existing_tweets(username)
                 resume_from_tweet_id = checkpoint.get('oldest_tweet_id')
-                existing_tweet_ids = {tweet.get('id') for tweet in existing_tweets if tweet.get('id')}
-                self.logger.info(f"Resuming from checkpoint with {len(existing_tweets)} existing tweets")
-                self.logger.info(f"   Will continue from tweet: {resume_from_tweet_id}")
-                self.logger.info(f"   Tracking {len(existing_tweet_ids)} existing tweet IDs")
+                # One pass with a single .get per tweet; ids stay strings to
+                # match what the playwright scraper compares against.
+                existing_tweet_ids = set()
+                for tweet in existing_tweets:
+                    tweet_id = tweet.get('id')
+                    if tweet_id:
+                        existing_tweet_ids.add(tweet_id)
+                self.logger.info("Resuming from checkpoint with %d existing tweets", len(existing_tweets))
+                self.logger.info("   Will continue from tweet: %s", resume_from_tweet_id)
+                self.logger.info("   Tracking %d existing tweet IDs", len(existing_tweet_ids))
             else:
-                self.logger.info(f"No checkpoint found for @{username}, starting fresh")
+                self.logger.info("No checkpoint found for @%s, starting fresh", username)
                 existing_tweet_ids = set()
         else:
-            self.logger.info(f"Starting fresh scrape for @{username}")
+            self.logger.info("Starting fresh scrape for @%s", username)
             existing_tweet_ids = set()
         
-        self.session_stats['start_time'] = time.time()
+        self.session_stats.start_time = time.time()
         self.is_running = True
         
         try:
@@ -291,28 +518,33 @@ class XScraper:
             user_data = scrape_result.get('user_data')
             
             if resume:
-                self.logger.info(f"Resume session completed: {len(new_tweets)} NEW (older) tweets collected")
+                self.logger.info("Resume session completed: %d NEW (older) tweets collected", len(new_tweets))
             else:
-                self.logger.info(f"Fresh scraping completed: {len(new_tweets)} tweets collected")
+                self.logger.info("Fresh scraping completed: %d tweets collected", len(new_tweets))
             
             if existing_tweets:
-                self.logger.info(f"Merging: {len(existing_tweets)} existing + {len(new_tweets)} new tweets")
+                self.logger.info("Merging: %d existing + %d new tweets", len(existing_tweets), len(new_tweets))
                 all_tweets = self.checkpoint_manager.merge_tweets(existing_tweets, new_tweets)
-                self.logger.info(f"Total tweets after merge: {len(all_tweets)}")
+                self.logger.info("Total tweets after merge: %d", len(all_tweets))
             else:
                 all_tweets = new_tweets
-                self.logger.info(f"No existing tweets to merge, total: {len(all_tweets)}")
+                self.logger.info("No existing tweets to merge, total: %d", len(all_tweets))
             
             self.scraped_tweets.extend(new_tweets)
-            self.session_stats['tweets_scraped'] += len(new_tweets)
+            self.session_stats.tweets_scraped += len(new_tweets)
             
             if all_tweets:
-                sorted_by_id = sorted(
-                    all_tweets,
-                    key=lambda x: int(x.get('id', '0')) if x.get('id', '').isdigit() else 0
-                )
-                oldest_tweet = sorted_by_id[0] if sorted_by_id else None 
-                newest_tweet = sorted_by_id[-1] if sorted_by_id else None 
+                # Only the extremes matter; one O(N) pass replaces the sort
+                # that existed just to read its first and last elements.
+                oldest_tweet = newest_tweet = None
+                min_id = max_id = None
+                for tweet in all_tweets:
+                    tweet_id = tweet.get('id', '')
+                    id_num = int(tweet_id) if tweet_id.isdigit() else 0
+                    if min_id is None or id_num < min_id:
+                        min_id, oldest_tweet = id_num, tweet
+                    if max_id is None or id_num > max_id:
+                        max_id, newest_tweet = id_num, tweet
                 
                 session_number = (checkpoint.get('session_count', 0) + 1) if checkpoint else 1
                 
@@ -326,15 +558,20 @@ class XScraper:
                     'last_session_tweets': len(new_tweets)
                 }
                 
-                self.logger.info(f"Saving checkpoint for session #{session_number}:")
-                self.logger.info(f"   • This session: {len(new_tweets)} new tweets")
-                self.logger.info(f"   • Total collected: {len(all_tweets)} tweets")
-                self.logger.info(f"   • Oldest tweet: {checkpoint_data['oldest_tweet_date']}")
+                self.logger.info("Saving checkpoint for session #%d:", session_number)
+                self.logger.info("   • This session: %d new tweets", len(new_tweets))
+                self.logger.info("   • Total collected: %d tweets", len(all_tweets))
+                self.logger.info("   • Oldest tweet: %s", checkpoint_data['oldest_tweet_date'])
                 
                 self.checkpoint_manager.save_checkpoint(username, checkpoint_data)
-                
-                
-                self.checkpoint_manager.save_all_tweets(username, all_tweets, user_data, checkpoint_data)
+
+                # Only this session's tweets are written, as a per-session
+                # delta; the checkpoint manager compacts deltas into the
+                # main JSONL log periodically. save_all_tweets remains for
+                # explicit full-JSON export.
+                await asyncio.to_thread(
+                    self.checkpoint_manager.append_delta,
+                    username, new_tweets, session_number)
             
             tweets = all_tweets  
             
@@ -360,25 +597,25 @@ class XScraper:
                     analysis_types or ['sentiment', 'topics', 'summary']
                 )
                 result['analysis'] = analysis_result
-                self.session_stats['analyses_performed'] += 1
+                self.session_stats.analyses_performed += 1
             
             
-            self.logger.info(f"Scraping completed: {len(filtered_tweets)} tweets retrieved")
-            self.logger.info(f"All data saved to data/{username}/tweets_{username}.json")
+            self.logger.info("Scraping completed: %d tweets retrieved", len(filtered_tweets))
+            self.logger.info("All data saved to data/%s/tweets_%s.jsonl", username, username)
             return result
             
         except Exception as e:
             self.logger.error(f"User tweet scraping failed: {str(e)}")
-            self.session_stats['errors_encountered'] += 1
+            self.session_stats.errors_encountered += 1
             raise
         finally:
             self.is_running = False
-            self.session_stats['end_time'] = time.time()
+            self.session_stats.end_time = time.time()
     
     async def scrape_user_tweets_by_search(self, username: str, since_date: str, until_date: str,
                                            max_tweets_per_range: Optional[int] = None,
                                            existing_tweet_ids: Optional[set] = None) -> Dict[str, Any]:
-        self.session_stats['start_time'] = time.time()
+        self.session_stats.start_time = time.time()
         self.is_running = True
         
         try:
@@ -403,59 +640,69 @@ class XScraper:
             
             tweets = scrape_result.get('tweets', [])
             self.scraped_tweets.extend(tweets)
-            self.session_stats['tweets_scraped'] += len(tweets)
+            self.session_stats.tweets_scraped += len(tweets)
             
             return scrape_result
             
         except Exception as e:
             self.logger.error(f"Search-based scraping failed: {str(e)}")
-            self.session_stats['errors_encountered'] += 1
+            self.session_stats.errors_encountered += 1
             raise
         finally:
             self.is_running = False
-            self.session_stats['end_time'] = time.time()
+            self.session_stats.end_time = time.time()
     
     def _apply_filters(self, tweets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        filter_settings = self.config_manager.get_filter_settings()
-        filtered_tweets = []
-        
-        for tweet in tweets:
-            user_followers = tweet.get('user', {}).get('followers_count', 0)
-            if user_followers < filter_settings['min_followers']:
-                continue
-            
-            if filter_settings['verified_only']:
-                user_verified = tweet.get('user', {}).get('verified', False)
-                if not user_verified:
-                    continue
-            
-            if filter_settings['exclude_retweets'] and tweet.get('is_retweet', False):
-                continue
-            
-            
-            if filter_settings['exclude_replies'] and tweet.get('is_reply', False):
-                continue
-            
-            
-            tweet_lang = tweet.get('lang', 'en')
-            allowed_languages = filter_settings['language']
-            if allowed_languages:
-                if ',' in allowed_languages:
-                    allowed_langs = [lang.strip() for lang in allowed_languages.split(',')]
-                    if tweet_lang not in allowed_langs:
-                        continue
-                else:
-                    if tweet_lang != allowed_languages:
-                        continue
-            
-            filtered_tweets.append(tweet)
-        
-        self.logger.info(f"Applied filters: {len(tweets)} -> {len(filtered_tweets)} tweets")
+        filter_settings = self._filter_settings
+        if not tweets:
+            return []
+
+        # Each filter contributes one boolean mask; combining them in numpy
+        # replaces ~10 Python dispatches per tweet with a few C-level array
+        # ops. Disabled filters skip their extraction pass entirely.
+        n = len(tweets)
+        mask = np.ones(n, dtype=bool)
+
+        min_followers = filter_settings['min_followers']
+        if min_followers:
+            followers = np.fromiter(
+                (t.get('user', {}).get('followers_count', 0) for t in tweets),
+                dtype=np.int64, count=n)
+            mask &= followers >= min_followers
+
+        if filter_settings['verified_only']:
+            mask &= np.fromiter(
+                (bool(t.get('user', {}).get('verified', False)) for t in tweets),
+                dtype=bool, count=n)
+
+        if filter_settings['exclude_retweets']:
+            mask &= ~np.fromiter(
+                (bool(t.get('is_retweet', False)) for t in tweets),
+                dtype=bool, count=n)
+
+        if filter_settings['exclude_replies']:
+            mask &= ~np.fromiter(
+                (bool(t.get('is_reply', False)) for t in tweets),
+                dtype=bool, count=n)
+
+        allowed_languages = filter_settings['language']
+        if allowed_languages:
+            if allowed_languages != self._allowed_langs_raw:
+                self._allowed_langs_raw = allowed_languages
+                self._allowed_langs = tuple(
+                    lang.strip() for lang in allowed_languages.split(','))
+            langs = np.array([t.get('lang', 'en') for t in tweets], dtype=object)
+            mask &= np.isin(langs, self._allowed_langs)
+
+        filtered_tweets = [tweets[i] for i in np.flatnonzero(mask)]
+        self.logger.info("Applied filters: %d -> %d tweets", len(tweets), len(filtered_tweets))
         return filtered_tweets
     
     async def _analyze_tweets(self, tweets: List[Dict[str, Any]], 
                             analysis_types: List[str]) -> Dict[str, Any]:
         try:
+            from .ai_analyzer import AnalysisType
+
             analysis_enums = []
             for analysis_type in analysis_types:
                 try:
@@ -466,7 +713,7 @@ class XScraper:
             if not analysis_enums:
                 return {"error": "No valid analysis types provided"}
             
-            self.logger.info(f"Performing AI analysis on {len(tweets)} tweets")
+            self.logger.info("Performing AI analysis on %d tweets", len(tweets))
             
             if not self.ai_analyzer:
                 return {"error": "AI analyzer not initialized"}
@@ -484,11 +731,10 @@ class XScraper:
     
     async def _save_results(self, results: Dict[str, Any], filename_prefix: str) -> None:  
         try:
-            scraping_settings = self.config_manager.get_scraping_settings()
-            base_output_dir = Path(scraping_settings['output_directory'])
-            output_format = scraping_settings.get('output_format', 'json')
-            
-            
+            base_output_dir = Path(self._scraping_settings['output_directory'])
+            output_format = self._scraping_settings.get('output_format', 'json')
+            self._ensure_writer()
+
             username = None
             if 'username' in results:
                 username = results['username']
@@ -500,17 +746,21 @@ class XScraper:
                 username = 'general'
             
             user_output_dir = base_output_dir / username
-            user_output_dir.mkdir(parents=True, exist_ok=True)
+            if user_output_dir not in self._created_dirs:
+                user_output_dir.mkdir(parents=True, exist_ok=True)
+                self._created_dirs.add(user_output_dir)
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            
-            
+
+            # Built once and shared by the JSON and CSV branches when
+            # output_format is 'all'.
+            tweets_list = results.get('tweets', [])
             tweets_data = {
                 'username': results.get('username'),
                 'user_data': results.get('user_data'),
                 'tweet_count': results.get('tweet_count'),
                 'filtered_tweet_count': results.get('filtered_tweet_count'),
-                'tweets': results.get('tweets', []),
+                'tweets': tweets_list,
                 'scraped_at': results.get('scraped_at'),
                 'query': results.get('query')
             }
@@ -524,9 +774,19 @@ class XScraper:
                 tweets_filepath = user_output_dir / f"{tweets_filename}.json"
                 
                 async def save_tweets_json():
-                    async with aiofiles.open(tweets_filepath, 'w', encoding='utf-8') as f:
-                        await f.write(json.dumps(tweets_data, indent=2, default=str))
-                    self.logger.info(f"Tweets saved to: {tweets_filepath}")
+                    # Keyed on content, not id(results): object ids are
+                    # reused after garbage collection, which could hand a
+                    # later save another result set's cached bytes.
+                    memo_key = (results.get('username'), results.get('query'),
+                                results.get('scraped_at'),
+                                hash(tuple(t.get('id') for t in tweets_list)))
+                    if self._json_memo[0] == memo_key:
+                        data = self._json_memo[1]
+                    else:
+                        data = await asyncio.to_thread(_encode_json, tweets_data)
+                        self._json_memo = (memo_key, data)
+                    self._write_q.put_nowait((tweets_filepath, data))
+                    self.logger.info(f"Tweets queued for save: {tweets_filepath}")
                 
                 save_tasks.append(save_tweets_json())
             
@@ -535,32 +795,11 @@ class XScraper:
                 tweets_csv_path = user_output_dir / f"{tweets_filename}.csv"
                 
                 async def save_tweets_csv():
-                    tweets_list = results.get('tweets', [])
                     if tweets_list:
-                        flattened_tweets = []
-                        for tweet in tweets_list:
-                            flat_tweet = {
-                                'id': tweet.get('id'),
-                                'text': tweet.get('text', ''),
-                                'created_at': tweet.get('created_at'),
-                                'username': tweet.get('user', {}).get('username', ''),
-                                'display_name': tweet.get('user', {}).get('display_name', ''),
-                                'followers_count': tweet.get('user', {}).get('followers_count', 0),
-                                'verified': tweet.get('user', {}).get('verified', False),
-                                'retweet_count': tweet.get('metrics', {}).get('retweet_count', 0),
-                                'favorite_count': tweet.get('metrics', {}).get('favorite_count', 0),
-                                'reply_count': tweet.get('metrics', {}).get('reply_count', 0),
-                                'view_count': tweet.get('metrics', {}).get('view_count', 0),
-                                'is_retweet': tweet.get('is_retweet', False),
-                                'is_reply': tweet.get('is_reply', False),
-                                'lang': tweet.get('lang', ''),
-                                'hashtags': ', '.join(tweet.get('hashtags', [])),
-                                'scraped_at': tweet.get('scraped_at')
-                            }
-                            flattened_tweets.append(flat_tweet)
-                        
-                        df = pd.DataFrame(flattened_tweets)
-                        df.to_csv(tweets_csv_path, index=False, encoding='utf-8')
+                        loop = asyncio.get_running_loop()
+                        await loop.run_in_executor(
+                            _get_csv_pool(), _serialize_csv,
+                            tweets_list, str(tweets_csv_path))
                         self.logger.info(f"Tweets saved to CSV: {tweets_csv_path}")
                 
                 save_tasks.append(save_tweets_csv())
@@ -568,7 +807,9 @@ class XScraper:
             
             if results.get('analysis'):
                 ai_dir = user_output_dir / 'ai_analysis'
-                ai_dir.mkdir(exist_ok=True)
+                if ai_dir not in self._created_dirs:
+                    ai_dir.mkdir(exist_ok=True)
+                    self._created_dirs.add(ai_dir)
                 
                 analysis_filename = f"analysis_{timestamp}.json"
                 analysis_filepath = ai_dir / analysis_filename
@@ -582,9 +823,9 @@ class XScraper:
                 }
                 
                 async def save_analysis_data():
-                    async with aiofiles.open(analysis_filepath, 'w', encoding='utf-8') as f:
-                        await f.write(json.dumps(analysis_data, indent=2, default=str))
-                    self.logger.info(f"AI analysis saved to: {analysis_filepath}")
+                    data = await asyncio.to_thread(_encode_json, analysis_data)
+                    self._write_q.put_nowait((analysis_filepath, data))
+                    self.logger.info(f"AI analysis queued for save: {analysis_filepath}")
                 
                 save_tasks.append(save_analysis_data())
             
@@ -599,8 +840,10 @@ class XScraper:
             self.logger.error(f"Failed to save results: {str(e)}")
     
     def get_session_stats(self) -> Dict[str, Any]:
-        stats = self.session_stats.copy()
-        
+        # The dict view only exists at the API boundary; internal updates
+        # are plain slotted-attribute stores.
+        stats = asdict(self.session_stats)
+
         if stats['start_time'] and stats['end_time']:
             stats['duration'] = stats['end_time'] - stats['start_time']
         elif stats['start_time']:
@@ -628,12 +871,33 @@ class XScraper:
     
     async def cleanup(self) -> None:
         try:
+            if self._keepalive_task is not None:
+                self._keepalive_task.cancel()
+                self._keepalive_task = None
+
+            if self._writer_task is not None:
+                try:
+                    await self._write_q.join()
+                finally:
+                    self._writer_task.cancel()
+                    self._writer_task = None
+
+            # The throttled progress saves can hold up to 5s of updates in
+            # memory; persist whatever is still buffered before shutdown.
+            if self.progress_manager:
+                self.progress_manager.flush()
+
             if self.playwright_scraper:
                 await self.playwright_scraper.cleanup()
             
             if self.ai_analyzer:
                 self.ai_analyzer.clear_cache()
-            
+
+            global _CSV_POOL
+            if _CSV_POOL is not None:
+                _CSV_POOL.shutdown(wait=True)
+                _CSV_POOL = None
+
             self.logger.info("Cleanup completed")
             
         except Exception as e: